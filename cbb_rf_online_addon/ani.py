@@ -1,6 +1,7 @@
 import bpy
 import struct
 from bpy_extras.io_utils import ImportHelper, ExportHelper
+from bpy_extras import anim_utils
 from bpy.types import Context, Event, Operator, Action
 from bpy.props import CollectionProperty, StringProperty, BoolProperty
 from bpy_extras.io_utils import ImportHelper
@@ -13,9 +14,20 @@ from mathutils import Vector, Quaternion, Matrix
 from .bn_skeleton import SkeletonData
 from pathlib import Path
 import os
+import io
+import mmap
+import numpy as np
 
 FRAME_SCALE = 160
 
+# Animated object header: euc-kr name, frame amount, frame count and 36 unknown bytes
+OBJECT_HEADER_STRUCT = struct.Struct("<100sHH36x")
+
+# Keyframe records as stored in the file: value followed by the scaled frame. Quaternions are stored as XYZW.
+ROTATION_KEYFRAME_DTYPE = np.dtype([("value", "<f4", 4), ("frame", "<u4")])
+VECTOR_KEYFRAME_DTYPE = np.dtype([("value", "<f4", 3), ("frame", "<u4")])
+FLOAT_KEYFRAME_DTYPE = np.dtype([("value", "<f4"), ("frame", "<u4")])
+
 class CBB_OT_ImportAni(Operator, ImportHelper):
     bl_idname = "cbb.ani_import"
     bl_label = "Import ani"
@@ -50,6 +62,67 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
         default=False
     ) # type: ignore
 
+    @staticmethod
+    def read_keyframes(reader: Utils.Serializer, keyframe_dtype: np.dtype) -> np.ndarray:
+        """
+        Reads a keyframe amount followed by that many keyframe records as a structured array. The reader's file must be a mmap.
+        """
+        keyframe_amount = reader.read_ushort()
+        mapped_file: mmap.mmap = reader.file
+        # Copied so the array does not keep the mapped file open
+        keyframes = np.frombuffer(mapped_file, dtype=keyframe_dtype, count=keyframe_amount, offset=mapped_file.tell()).copy()
+        mapped_file.seek(keyframes.nbytes, 1)
+        return keyframes
+
+    # Same group keyframe_insert uses for object transform channels
+    OBJECT_ACTION_GROUP = "Object Transforms"
+
+    @staticmethod
+    def insert_keyframes(action: Action, datablock: bpy.types.ID, data_path: str, frames: np.ndarray, values: np.ndarray, group_name: str) -> list[bpy.types.FCurve]:
+        """
+        Inserts all keyframes of an animated property at once, instead of calling keyframe_insert per keyframe.
+        Like keyframe_insert, a keyframe on a frame that already has one replaces its value, both within frames and against
+        keyframes already on the F-Curve, e.g. when a name is animated twice in the same file.
+        The F-Curves are created in the datablock's slot of the action, so the action must already be assigned to it.
+        The returned F-Curves are not sorted nor have their handles calculated yet, fcurve.update() has to be called on them once everything is inserted.
+
+        :param frames: (N,) array with the frame of each keyframe.
+        :param values: (N, array_length) array with the property values at each keyframe.
+        :return: list with the F-Curve of each array index.
+        """
+        # The last keyframe read on a frame wins
+        frames, last_indices = np.unique(np.asarray(frames, dtype=np.float32)[::-1], return_index=True)
+        values = values[::-1][last_indices]
+        
+        fcurves = [action.fcurve_ensure_for_datablock(datablock, data_path, index=array_index, group_name=group_name) for array_index in range(values.shape[1])]
+        
+        interpolation = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items[bpy.context.preferences.edit.keyframe_new_interpolation_type].value
+        for array_index, fcurve in enumerate(fcurves):
+            keyframe_points = fcurve.keyframe_points
+            existing_amount = len(keyframe_points)
+            co = np.empty(existing_amount * 2, dtype=np.float32)
+            interpolations = np.empty(existing_amount, dtype=np.int32)
+            keyframe_points.foreach_get("co", co)
+            keyframe_points.foreach_get("interpolation", interpolations)
+            
+            # Keyframes on frames the F-Curve already has overwrite those values, the rest are appended
+            existing_frames = co[0::2]
+            existing_order = np.argsort(existing_frames, kind="stable")
+            matched_positions = np.minimum(np.searchsorted(existing_frames[existing_order], frames), max(existing_amount - 1, 0))
+            matched = existing_frames[existing_order][matched_positions] == frames if existing_amount else np.zeros(len(frames), dtype=bool)
+            co[existing_order[matched_positions[matched]] * 2 + 1] = values[matched, array_index]
+            
+            appended = ~matched
+            appended_amount = int(np.count_nonzero(appended))
+            appended_co = np.empty(appended_amount * 2, dtype=np.float32)
+            appended_co[0::2] = frames[appended]
+            appended_co[1::2] = values[appended, array_index]
+            
+            keyframe_points.add(appended_amount)
+            keyframe_points.foreach_set("co", np.concatenate((co, appended_co)))
+            keyframe_points.foreach_set("interpolation", np.concatenate((interpolations, np.full(appended_amount, interpolation, dtype=np.int32))))
+        return fcurves
+
     def execute(self, context):
         return self.import_animations_from_files(context)
 
@@ -70,63 +143,51 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
                 frame_amount = []
                 frame_counts = []
                 
-                rotation_keyframe_counts = []
-                rotation_frames: list[list[tuple[Quaternion, int]]] = []
-                
-                position_keyframe_counts = []
-                position_frames: list[list[tuple[Vector, int]]] = []
-                
-                scale_keyframe_counts = []
-                scale_frames: list[list[tuple[Vector, int]]] = []
-                
-                unknown_keyframe_counts = []
-                unknown_frames: list[list[tuple[float, int]]] = []
+                # Keyframes are kept as structured arrays with "value" and "frame" fields. Rotations are converted to WXYZ order.
+                # Their lengths are the keyframe counts stored in the file.
+                rotation_frames: list[np.ndarray] = []
+                position_frames: list[np.ndarray] = []
+                scale_frames: list[np.ndarray] = []
+                unknown_frames: list[np.ndarray] = []
                 
                 
                 co_conv = Utils.CoordinatesConverter(CoordsSys._3DSMax, CoordsSys.Blender)
                 
-                file_base_name = Path(file.name).stem.split("_")[0]
+                # The extension was checked above, so the stem is the name without its last 4 characters
+                animation_name = file.name[:-4]
+                file_base_name = animation_name.split("_", 1)[0]
                 
                 try:
-                    with open(filepath, "rb") as f:
+                    with open(filepath, "rb") as opened_file, mmap.mmap(opened_file.fileno(), 0, access=mmap.ACCESS_READ) as f:
                         reader = Utils.Serializer(f, Utils.Serializer.Endianness.Little, Utils.Serializer.Quaternion_Order.XYZW, Utils.Serializer.Matrix_Order.ColumnMajor, co_conv)
                         animated_object_count = reader.read_ushort()
                         for i in range(animated_object_count):
-                            animated_object_names.append(reader.read_fixed_string(100, "euc-kr"))
+                            raw_name, object_frame_amount, object_frame_count = OBJECT_HEADER_STRUCT.unpack_from(f, f.tell())
+                            f.seek(OBJECT_HEADER_STRUCT.size, 1)
+                            
+                            animated_object_names.append(raw_name.split(b"\x00", 1)[0].decode("euc-kr"))
                             # If set to 0 animation is not considered
-                            frame_amount.append(reader.read_ushort())
+                            frame_amount.append(object_frame_amount)
                             # If set higher than the amount of keyframes that are registered, it affects looping animations, which does indicate this is the maximum frame.
                             # If set lower, the highest keyframe set (along the animation's keyframes) defines the maximum frame. In this case, this number is ignored.
                             # The reason why this value is not set in seconds or frames or whatever else is unknown. However, a single frame has a value of 160 for this number.
                             # Since the value is an u16, around 409 or so frames the number would overflow and the effect of this is also unknown.
-                            frame_counts.append(reader.read_ushort())
-                            
-                            f.seek(36,1)
-                            
-                            def __read_rotation_frames(reader: Utils.Serializer):
-                                return (reader.read_converted_quaternion(), reader.read_uint())
+                            frame_counts.append(object_frame_count)
                             
-                            def __read_position_frames(reader: Utils.Serializer):
-                                return (reader.read_converted_vector3f(), reader.read_uint())
+                            rotation_keyframes = CBB_OT_ImportAni.read_keyframes(reader, ROTATION_KEYFRAME_DTYPE)
+                            rotation_keyframes["value"] = co_conv.convert_quaternion_array(rotation_keyframes["value"][:, [3, 0, 1, 2]])
+                            rotation_frames.append(rotation_keyframes)
                             
-                            def __read_scale_frames(reader: Utils.Serializer):
-                                return (reader.read_vector3f(), reader.read_uint())
+                            position_keyframes = CBB_OT_ImportAni.read_keyframes(reader, VECTOR_KEYFRAME_DTYPE)
+                            position_keyframes["value"] = co_conv.convert_vector3f_array(position_keyframes["value"])
+                            position_frames.append(position_keyframes)
                             
-                            def __read_unknown_frames(reader: Utils.Serializer):
-                                return (reader.read_float(), reader.read_uint())
+                            scale_keyframes = CBB_OT_ImportAni.read_keyframes(reader, VECTOR_KEYFRAME_DTYPE)
+                            scale_frames.append(scale_keyframes)
                             
-                            rotation_keyframe_counts.append(reader.read_ushort())
-                            
-                            rotation_frames.append([__read_rotation_frames(reader) for _ in range(rotation_keyframe_counts[i])])
-                            
-                            position_keyframe_counts.append(reader.read_ushort())
-                            position_frames.append([__read_position_frames(reader) for _ in range(position_keyframe_counts[i])])
-                            
-                            scale_keyframe_counts.append(reader.read_ushort())
-                            scale_frames.append([__read_scale_frames(reader) for _ in range(scale_keyframe_counts[i])])
-                            
-                            unknown_keyframe_counts.append(reader.read_ushort()) # What is being animated with a single float in the range of 0 to 1???
-                            unknown_frames.append([__read_unknown_frames(reader) for _ in range(unknown_keyframe_counts[i])])
+                            # What is being animated with a single float in the range of 0 to 1???
+                            unknown_keyframes = CBB_OT_ImportAni.read_keyframes(reader, FLOAT_KEYFRAME_DTYPE)
+                            unknown_frames.append(unknown_keyframes)
 
                 except Exception as e:
                     msg_handler.report("ERROR", f"Failed to read file at [{filepath}]: {e}")
@@ -141,8 +202,9 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
                     objects_collection = bpy.context.selected_objects
                 else:
                     matching_collection = None
+                    file_base_name_lower = file_base_name.casefold()
                     for collection in bpy.data.collections:
-                        if collection.name.casefold() == file_base_name.casefold():
+                        if collection.name.casefold() == file_base_name_lower:
                             matching_collection = collection
                             break
                     
@@ -168,21 +230,20 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
                         msg_handler.report("ERROR", f"Armature [{target_armature}] which is the target of the imported animation has been found not valid. Aborting. Reason: {e}")
                         continue
                 
+                objects_by_name = {obj.name: obj for obj in objects_collection}
+                bone_names = {bone.name for bone in target_armature.data.bones} if target_armature else set()
+                
                 for i, object_name in enumerate(animated_object_names):
                     found = False
                     
-                    for obj in objects_collection:
-                        if obj.name == object_name:
-                            found_objects.append((obj, i))
-                            found = True
-                            break
+                    obj = objects_by_name.get(object_name)
+                    if obj is not None:
+                        found_objects.append((obj, i))
+                        found = True
 
-                    if not found and target_armature:
-                        for bone in target_armature.data.bones:
-                            if bone.name == object_name:
-                                found_bones.append((bone.name, i))
-                                found = True
-                                break
+                    if not found and object_name in bone_names:
+                        found_bones.append((object_name, i))
+                        found = True
 
                     if not found and self.ignore_not_found == False:
                         msg_handler.report("ERROR", f"Object or bone with name '{object_name}' not found in the selection.")
@@ -197,10 +258,11 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
                     # Create ONE action for the entire animation - all objects/bones will share this action
                     # but each will have its own slot with isolated data paths.
                     # This is only possible on newer Blender versions
-                    animation_name = Path(file.name).stem
                     action = bpy.data.actions.new(name=animation_name)
                     action.use_fake_user = True  # Prevent deletion on save
-                    highest_frame = 0
+                    # Kept in the file's frame units, converted once when setting the range
+                    highest_scaled_frame = 0
+                    inserted_fcurves: list[bpy.types.FCurve] = []
                     
                     # Import object-level animations (MESH and EMPTY objects)
                     for obj, index in found_objects:
@@ -212,40 +274,32 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
                         
                         # ANI format stores quaternion rotations, so ensure the object
                         # is in quaternion rotation mode for keyframes to take effect
-                        obj.rotation_mode = 'QUATERNION'
+                        if obj.rotation_mode != 'QUATERNION':
+                            obj.rotation_mode = 'QUATERNION'
+                        
+                        rotation_keyframes = rotation_frames[index]
+                        position_keyframes = position_frames[index]
+                        scale_keyframes = scale_frames[index]
                         
                         # Keyframe the object - these keyframes go into this object's slot
                         # No data path pollution because each object has its own slot
-                        for count in range(rotation_keyframe_counts[index]):
-                            animated_rotation, scaled_frame = rotation_frames[index][count]
-                            frame = scaled_frame / FRAME_SCALE
-
-                            if highest_frame < frame:
-                                highest_frame = frame
-
-                            rot = animated_rotation.conjugated()
-                            obj.rotation_quaternion = rot
-                            obj.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-
-                        for count in range(position_keyframe_counts[index]):
-                            animated_position, scaled_frame = position_frames[index][count]
-                            frame = scaled_frame / FRAME_SCALE
-
-                            if highest_frame < frame:
-                                highest_frame = frame
-
-                            obj.location = animated_position
-                            obj.keyframe_insert(data_path="location", frame=frame)
+                        if len(rotation_keyframes) > 0:
+                            frames = rotation_keyframes["frame"] / FRAME_SCALE
+                            values = rotation_keyframes["value"] * np.array((1.0, -1.0, -1.0, -1.0), dtype=np.float32)
+                            highest_scaled_frame = max(highest_scaled_frame, int(rotation_keyframes["frame"].max()))
+                            inserted_fcurves += CBB_OT_ImportAni.insert_keyframes(action, obj, "rotation_quaternion", frames, values, CBB_OT_ImportAni.OBJECT_ACTION_GROUP)
+
+                        if len(position_keyframes) > 0:
+                            frames = position_keyframes["frame"] / FRAME_SCALE
+                            values = position_keyframes["value"]
+                            highest_scaled_frame = max(highest_scaled_frame, int(position_keyframes["frame"].max()))
+                            inserted_fcurves += CBB_OT_ImportAni.insert_keyframes(action, obj, "location", frames, values, CBB_OT_ImportAni.OBJECT_ACTION_GROUP)
                         
-                        for count in range(scale_keyframe_counts[index]):
-                            animated_scale, scaled_frame = scale_frames[index][count]
-                            frame = scaled_frame / FRAME_SCALE
-
-                            if highest_frame < frame:
-                                highest_frame = frame
-
-                            obj.scale = animated_scale
-                            obj.keyframe_insert(data_path="scale", frame=frame)
+                        if len(scale_keyframes) > 0:
+                            frames = scale_keyframes["frame"] / FRAME_SCALE
+                            values = scale_keyframes["value"]
+                            highest_scaled_frame = max(highest_scaled_frame, int(scale_keyframes["frame"].max()))
+                            inserted_fcurves += CBB_OT_ImportAni.insert_keyframes(action, obj, "scale", frames, values, CBB_OT_ImportAni.OBJECT_ACTION_GROUP)
                     
                     # Import bone animations (armature)
                     if target_armature and found_bones:
@@ -257,55 +311,48 @@ class CBB_OT_ImportAni(Operator, ImportHelper):
                         
                         for bone_name, index in found_bones:
                             bone_id = skeleton_data.bone_name_to_id[bone_name]
+                            pose_bone = target_armature.pose.bones[bone_name]
+                            bone_local_rotation = skeleton_data.bone_local_rotations[bone_id]
+                            bone_local_position = skeleton_data.bone_local_positions[bone_id]
+                            rotation_keyframes = rotation_frames[index]
+                            position_keyframes = position_frames[index]
+                            scale_keyframes = scale_frames[index]
                             
-                            if rotation_keyframe_counts[index] == 0:
-                                target_armature.pose.bones[bone_name].rotation_quaternion = Quaternion((1.0, 0.0, 0.0, 0.0))
-                                target_armature.pose.bones[bone_name].keyframe_insert(data_path="rotation_quaternion", frame=0)
-                            for count in range(rotation_keyframe_counts[index]):
-                                animated_rotation, scaled_frame = rotation_frames[index][count]
-                                frame = scaled_frame/FRAME_SCALE
-                                
-                                if highest_frame < frame:
-                                    highest_frame = frame
-                                    
-                                rot = Utils.get_local_rotation(skeleton_data.bone_local_rotations[bone_id], Quaternion((-animated_rotation.w, animated_rotation.x, animated_rotation.y, animated_rotation.z)))
-                                
-                                target_armature.pose.bones[bone_name].rotation_quaternion = rot
-                                target_armature.pose.bones[bone_name].keyframe_insert(data_path="rotation_quaternion", frame=frame)
-                                
-                            if position_keyframe_counts[index] == 0:
-                                target_armature.pose.bones[bone_name].location = Vector((0.0, 0.0, 0.0))
-                                target_armature.pose.bones[bone_name].keyframe_insert(data_path="location", frame=0)
-                            for count in range(position_keyframe_counts[index]):
-                                animated_position, scaled_frame = position_frames[index][count]
-                                frame = scaled_frame/FRAME_SCALE
+                            if len(rotation_keyframes) == 0:
+                                frames = np.zeros(1, dtype=np.float32)
+                                values = np.array([(1.0, 0.0, 0.0, 0.0)], dtype=np.float32)
+                            else:
+                                frames = rotation_keyframes["frame"] / FRAME_SCALE
+                                values = Utils.get_local_rotations_array(bone_local_rotation, rotation_keyframes["value"] * np.array((-1.0, 1.0, 1.0, 1.0), dtype=np.float32))
+                                highest_scaled_frame = max(highest_scaled_frame, int(rotation_keyframes["frame"].max()))
+                            inserted_fcurves += CBB_OT_ImportAni.insert_keyframes(action, target_armature, pose_bone.path_from_id("rotation_quaternion"), frames, values, bone_name)
                                 
-                                if highest_frame < frame:
-                                    highest_frame = frame
-                                
-                                loc = Utils.get_local_position(skeleton_data.bone_local_positions[bone_id], skeleton_data.bone_local_rotations[bone_id], animated_position)
-
-                                target_armature.pose.bones[bone_name].location = loc
-                                target_armature.pose.bones[bone_name].keyframe_insert(data_path="location", frame=frame)
+                            if len(position_keyframes) == 0:
+                                frames = np.zeros(1, dtype=np.float32)
+                                values = np.zeros((1, 3), dtype=np.float32)
+                            else:
+                                frames = position_keyframes["frame"] / FRAME_SCALE
+                                values = Utils.get_local_positions_array(bone_local_position, bone_local_rotation, position_keyframes["value"])
+                                highest_scaled_frame = max(highest_scaled_frame, int(position_keyframes["frame"].max()))
+                            inserted_fcurves += CBB_OT_ImportAni.insert_keyframes(action, target_armature, pose_bone.path_from_id("location"), frames, values, bone_name)
                             
-                            if scale_keyframe_counts[index] == 0:
-                                target_armature.pose.bones[bone_name].scale = Vector((1.0, 1.0, 1.0))
-                                target_armature.pose.bones[bone_name].keyframe_insert(data_path="scale", frame=0)
-                            for count in range(scale_keyframe_counts[index]):
-                                animated_scale, scaled_frame = scale_frames[index][count]
-                                frame = scaled_frame/FRAME_SCALE
-                                
-                                if highest_frame < frame:
-                                    highest_frame = frame
-
-                                target_armature.pose.bones[bone_name].scale = animated_scale
-                                target_armature.pose.bones[bone_name].keyframe_insert(data_path="scale", frame=frame)
-
+                            if len(scale_keyframes) == 0:
+                                frames = np.zeros(1, dtype=np.float32)
+                                values = np.ones((1, 3), dtype=np.float32)
+                            else:
+                                frames = scale_keyframes["frame"] / FRAME_SCALE
+                                values = scale_keyframes["value"]
+                                highest_scaled_frame = max(highest_scaled_frame, int(scale_keyframes["frame"].max()))
+                            inserted_fcurves += CBB_OT_ImportAni.insert_keyframes(action, target_armature, pose_bone.path_from_id("scale"), frames, values, bone_name)
+
+                    # Sort and calculate handles only once all keyframes are in
+                    for fcurve in inserted_fcurves:
+                        fcurve.update()
+                    
                     # Set animation frames range
-                    action.frame_range = (0, highest_frame)
+                    action.frame_range = (0, highest_scaled_frame / FRAME_SCALE)
 
                 except Exception as e:
-                    animation_name = Path(file.name).stem
                     msg_handler.report("ERROR", f"Failed to create animation {animation_name}: {e}")
                     traceback.print_exc()
                     return {"CANCELLED"}
@@ -362,6 +409,13 @@ class CBB_OT_ExportAni(Operator, ExportHelper):
         total_actions_scanned = 0
         actions_with_objects = 0
         
+        # Actions referenced by each object's NLA strips, gathered once for the NLA fallback below
+        objects_nla_actions = {
+            obj: Utils.get_actions_from_nla_tracks(obj)
+            for obj in bpy.data.objects
+            if obj.animation_data and obj.animation_data.nla_tracks
+        }
+        
         for action in bpy.data.actions:
             if not action:
                 continue
@@ -399,11 +453,7 @@ class CBB_OT_ExportAni(Operator, ExportHelper):
             
             # Fallback: Check NLA tracks for stashed/pushed actions
             nla_found_count = 0
-            for obj in bpy.data.objects:
-                if not (obj.animation_data and obj.animation_data.nla_tracks):
-                    continue
-                    
-                nla_actions = Utils.get_actions_from_nla_tracks(obj)
+            for obj, nla_actions in objects_nla_actions.items():
                 if action in nla_actions and obj not in linked_objects:
                     linked_objects.append(obj)
                     msg_handler.debug_print(f"      NLA fallback → Added object: '{obj.name}' ({obj.type}) from NLA track")
@@ -440,6 +490,172 @@ class CBB_OT_ExportAni(Operator, ExportHelper):
         
         return {"FINISHED"}
         
+    @staticmethod
+    def can_sample_fcurves(obj: bpy.types.Object) -> bool:
+        """
+        Whether the transforms of the object (or its pose bones) come from the active action alone, so they can be read from its fcurves instead of evaluating the scene.
+        """
+        animation_data = obj.animation_data
+        if animation_data is None:
+            return False
+        if len(animation_data.drivers) > 0:
+            return False
+        if animation_data.use_nla and any(not track.mute for track in animation_data.nla_tracks):
+            return False
+        return True
+
+    @staticmethod
+    def get_slot_fcurves(action: Action, slot) -> dict[tuple[str, int], bpy.types.FCurve]:
+        """
+        Maps (data_path, array_index) to the fcurves of an action slot, since channelbag.fcurves.find scans every fcurve.
+        """
+        channelbag = anim_utils.action_get_channelbag_for_slot(action, slot)
+        if channelbag is None:
+            return {}
+        return {(fcurve.data_path, fcurve.array_index): fcurve for fcurve in channelbag.fcurves}
+
+    @staticmethod
+    def sample_fcurves(slot_fcurves: dict[tuple[str, int], bpy.types.FCurve], data_path: str, default_value, frames: range) -> np.ndarray:
+        """
+        Evaluates every array index of data_path at the given frames. Indices without an fcurve keep the property's current value.
+        """
+        values = np.empty((len(frames), len(default_value)), dtype=np.float32)
+        frame_array = np.array(frames, dtype=np.float32)
+        interpolation_items = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items
+        linear_interpolation = interpolation_items["LINEAR"].value
+        constant_interpolation = interpolation_items["CONSTANT"].value
+        for array_index in range(len(default_value)):
+            fcurve = slot_fcurves.get((data_path, array_index))
+            # Muted fcurves are skipped by animation evaluation
+            if fcurve is None or fcurve.mute:
+                values[:, array_index] = default_value[array_index]
+                continue
+
+            # Without modifiers the curve can often be resolved from its control points alone, read in one call
+            keyframe_amount = len(fcurve.keyframe_points)
+            if len(fcurve.modifiers) == 0 and keyframe_amount > 0:
+                keyframe_co = np.empty(keyframe_amount * 2, dtype=np.float32)
+                fcurve.keyframe_points.foreach_get("co", keyframe_co)
+                keyframe_co = keyframe_co.reshape(-1, 2)
+                
+                # Baked fcurves already hold a keyframe on every exported frame, so their values can be copied as they are
+                if keyframe_amount >= len(frames):
+                    keyframe_indices = np.minimum(np.searchsorted(keyframe_co[:, 0], frame_array), keyframe_amount - 1)
+                    if np.array_equal(keyframe_co[keyframe_indices, 0], frame_array):
+                        values[:, array_index] = keyframe_co[keyframe_indices, 1]
+                        continue
+                
+                # Linear and constant segments are resampled directly; both hold the end values outside the keyed range like constant extrapolation
+                if fcurve.extrapolation == 'CONSTANT':
+                    keyframe_interpolations = np.empty(keyframe_amount, dtype=np.int32)
+                    fcurve.keyframe_points.foreach_get("interpolation", keyframe_interpolations)
+                    # A segment uses the interpolation of its left keyframe, so the last one never matters
+                    segment_interpolations = keyframe_interpolations[:-1]
+                    if np.all(segment_interpolations == linear_interpolation):
+                        values[:, array_index] = np.interp(frame_array, keyframe_co[:, 0], keyframe_co[:, 1])
+                        continue
+                    if np.all(segment_interpolations == constant_interpolation):
+                        keyframe_indices = np.maximum(np.searchsorted(keyframe_co[:, 0], frame_array, side="right") - 1, 0)
+                        values[:, array_index] = keyframe_co[keyframe_indices, 1]
+                        continue
+
+            values[:, array_index] = np.fromiter((fcurve.evaluate(frame) for frame in frames), dtype=np.float32, count=len(frames))
+        return values
+
+    @staticmethod
+    def sample_object_transforms(obj: bpy.types.Object, action: Action, frames: range):
+        """
+        Reads the object's rotation, position and scale at each frame straight from the action's fcurves.
+        Returns None when matrix_basis could differ from the raw channels, in which case the scene has to be evaluated.
+        """
+        if not CBB_OT_ExportAni.can_sample_fcurves(obj) or obj.rotation_mode != 'QUATERNION':
+            return None
+        if Vector(obj.delta_location) != Vector((0.0, 0.0, 0.0)) or Quaternion(obj.delta_rotation_quaternion) != Quaternion() or Vector(obj.delta_scale) != Vector((1.0, 1.0, 1.0)):
+            return None
+        
+        slot_fcurves = CBB_OT_ExportAni.get_slot_fcurves(action, obj.animation_data.action_slot)
+        rotations = CBB_OT_ExportAni.sample_fcurves(slot_fcurves, "rotation_quaternion", obj.rotation_quaternion, frames)
+        positions = CBB_OT_ExportAni.sample_fcurves(slot_fcurves, "location", obj.location, frames)
+        scales = CBB_OT_ExportAni.sample_fcurves(slot_fcurves, "scale", obj.scale, frames)
+        
+        # Negative or zero scales change what matrix_basis decomposes into
+        if np.any(scales <= 0.0):
+            return None
+        
+        # Match matrix_basis.to_quaternion(), which is normalized and has a positive W
+        rotations /= np.linalg.norm(rotations, axis=1, keepdims=True)
+        rotations[rotations[:, 0] < 0.0] *= -1.0
+        
+        return rotations, positions, scales
+
+    @staticmethod
+    def evaluate_object_transforms(obj: bpy.types.Object, frames: range):
+        """
+        Steps the scene through each frame and decomposes the evaluated matrix_basis, in the same layout as sample_object_transforms.
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        local_matrices = np.empty((len(frames), 4, 4), dtype=np.float64)
+        
+        for frame_index, frame in enumerate(frames):
+            # Set the scene to this frame
+            bpy.context.scene.frame_set(frame)
+            
+            # Force update
+            depsgraph.update()
+            
+            # Get the evaluated object (this includes constraints, drivers, etc.)
+            object_eval = obj.evaluated_get(depsgraph)
+            
+            # Read matrix_basis - this is the object's local transform (independent of parent)
+            # This is what the animator keyframes and what the ANI format expects
+            local_matrices[frame_index] = object_eval.matrix_basis
+        
+        positions, rotations, scales = Utils.decompose_matrices_array(local_matrices)
+        return rotations, positions, scales
+
+    @staticmethod
+    def evaluate_pose_bone_transforms(armature: bpy.types.Object, bone_names: list[str], frames: range) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Steps the scene through each frame once and reads the evaluated rotation, location and scale of every given pose bone.
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        pose_bone_amount = len(armature.pose.bones)
+        rotations = np.empty((len(frames), pose_bone_amount * 4), dtype=np.float32)
+        positions = np.empty((len(frames), pose_bone_amount * 3), dtype=np.float32)
+        scales = np.empty((len(frames), pose_bone_amount * 3), dtype=np.float32)
+        
+        for frame_index, frame in enumerate(frames):
+            # Set the scene to this frame
+            bpy.context.scene.frame_set(frame)
+            
+            # Force update
+            depsgraph.update()
+            
+            # Get the evaluated armature (includes constraints, drivers, etc.)
+            object_eval = armature.evaluated_get(depsgraph)
+            pose_bones_eval = object_eval.pose.bones
+            
+            # Channels of all pose bones are read at once, without going through a mathutils value per bone
+            pose_bones_eval.foreach_get("rotation_quaternion", rotations[frame_index])
+            pose_bones_eval.foreach_get("location", positions[frame_index])
+            pose_bones_eval.foreach_get("scale", scales[frame_index])
+        
+        rotations = rotations.reshape(len(frames), pose_bone_amount, 4)
+        positions = positions.reshape(len(frames), pose_bone_amount, 3)
+        scales = scales.reshape(len(frames), pose_bone_amount, 3)
+        pose_bone_indices = {bone_name: armature.pose.bones.find(bone_name) for bone_name in bone_names}
+        return {bone_name: (rotations[:, bone_index], positions[:, bone_index], scales[:, bone_index]) for bone_name, bone_index in pose_bone_indices.items()}
+
+    @staticmethod
+    def pack_keyframes(keyframe_dtype: np.dtype, keyframe_values: np.ndarray, scaled_frames: np.ndarray) -> bytes:
+        """
+        Packs a whole keyframe block into one buffer, with the frame of each keyframe taken from its position in scaled_frames.
+        """
+        keyframes = np.empty(len(keyframe_values), dtype=keyframe_dtype)
+        keyframes["value"] = keyframe_values
+        keyframes["frame"] = scaled_frames[:len(keyframe_values)]
+        return keyframes.tobytes()
+
     def export_action(self, action: Action, action_objects: list[bpy.types.Object], directory: str, msg_handler: Utils.MessageHandler):
         print(f"Exporting action {action.name}")
         
@@ -469,7 +685,9 @@ class CBB_OT_ExportAni(Operator, ExportHelper):
             # Ensure the object has the action assigned
             if obj.animation_data is None:
                 obj.animation_data_create()
-            obj.animation_data.action = action
+            # Reassigning the same action still tags the object for a depsgraph update
+            if obj.animation_data.action != action:
+                obj.animation_data.action = action
         
         filepath = bpy.path.ensure_ext(directory + "/" + action.name, self.filename_ext)
         
@@ -483,6 +701,10 @@ class CBB_OT_ExportAni(Operator, ExportHelper):
         total_frames = int(last_frame)  # For the frame count field
         total_export_frames = int(last_frame) + 1  # Actual number of keyframes exported
         
+        # Objects export every frame from 0, bones start at 1 since frame 0 holds their bind pose
+        object_export_frames = range(0, total_export_frames)
+        bone_export_frames = range(1, total_export_frames)
+        
         export_object_names = []
         export_unique_keyframe_counts = []
         export_maximum_frames = []
@@ -495,226 +717,201 @@ class CBB_OT_ExportAni(Operator, ExportHelper):
         export_unknown_keyframe_counts = []
         export_unknown_keyframes = {}
         
-        msg_handler.debug_print(f"Animation [{action.name}] frame range: {int(action.frame_range[0])} - {int(action.frame_range[1])}")
+        msg_handler.debug_print(f"Animation [{action.name}] frame range: {int(initial_frame)} - {int(last_frame)}")
+        
+        def add_object_animation_data(_object_names, _total_frames, _total_export_frames, _export_rotation_keyframes, _export_position_keyframes, _export_scale_keyframes):
+            nonlocal export_object_names
+            nonlocal export_unique_keyframe_counts
+            nonlocal export_maximum_frames
+            nonlocal export_rotation_keyframe_counts
+            nonlocal export_rotation_keyframes
+            nonlocal export_position_keyframe_counts
+            nonlocal export_position_keyframes
+            nonlocal export_scale_keyframe_counts
+            nonlocal export_scale_keyframes
+            nonlocal export_unknown_keyframe_counts
+            nonlocal export_unknown_keyframes
+            
+            # All the given names share the same keyframes, e.g. the sub objects a mesh is split into
+            first_index = len(export_object_names)
+            object_amount = len(_object_names)
+            
+            export_object_names.extend(_object_names)
+            export_unique_keyframe_counts.extend([_total_frames] * object_amount)
+            export_maximum_frames.extend([_total_frames*FRAME_SCALE] * object_amount)
+            export_rotation_keyframe_counts.extend([_total_export_frames] * object_amount)
+            export_position_keyframe_counts.extend([_total_export_frames] * object_amount)
+            export_scale_keyframe_counts.extend([_total_export_frames] * object_amount)
+            export_unknown_keyframe_counts.extend([0] * object_amount)
+            
+            for index in range(first_index, first_index + object_amount):
+                export_rotation_keyframes[index] = _export_rotation_keyframes
+                export_position_keyframes[index] = _export_position_keyframes
+                export_scale_keyframes[index] = _export_scale_keyframes
         
         # ACTION SLOTS: Each object in action_objects has its own slot within the same action
         # We can iterate through them and export each slot's data
         for object in action_objects:
             
             if object.type in {"MESH", "EMPTY"}:
-                def add_object_animation_data(_object_name, _total_frames, _total_export_frames, _export_rotation_keyframes, _export_position_keyframes, _export_scale_keyframes):
-                    nonlocal export_object_names
-                    nonlocal export_unique_keyframe_counts
-                    nonlocal export_maximum_frames
-                    nonlocal export_rotation_keyframe_counts
-                    nonlocal export_rotation_keyframes
-                    nonlocal export_position_keyframe_counts
-                    nonlocal export_position_keyframes
-                    nonlocal export_scale_keyframe_counts
-                    nonlocal export_scale_keyframes
-                    nonlocal export_unknown_keyframe_counts
-                    nonlocal export_unknown_keyframes
-                    
-                    index = len(export_object_names)
-                    
-                    export_object_names.append(_object_name)
-                    export_unique_keyframe_counts.append(_total_frames)
-                    export_maximum_frames.append(_total_frames*FRAME_SCALE)
-                    export_rotation_keyframe_counts.append(_total_export_frames)
-                    export_position_keyframe_counts.append(_total_export_frames)
-                    export_scale_keyframe_counts.append(_total_export_frames)
-                    export_unknown_keyframe_counts.append(0)
-                    
-                    export_rotation_keyframes[index] = _export_rotation_keyframes
-                    export_position_keyframes[index] = _export_position_keyframes
-                    export_scale_keyframes[index] = _export_scale_keyframes
-                
                 object_name = object.name
-                temp_rotation_keyframes = []
-                temp_position_keyframes = []
-                temp_scale_keyframes = []
                 
                 # SIMPLIFIED OBJECT EXPORT:
                 # For objects, matrix_basis IS the local transform (what the animator keyframes).
                 # Unlike bones, objects don't have a separate "rest pose"
                 # We simply export matrix_basis for all frames including frame 0.
                 
-                depsgraph = bpy.context.evaluated_depsgraph_get()
+                # Without drivers or NLA the channels can be read from the fcurves, skipping a scene evaluation per frame
+                sampled_transforms = CBB_OT_ExportAni.sample_object_transforms(object, action, object_export_frames)
+                if sampled_transforms is None:
+                    sampled_transforms = CBB_OT_ExportAni.evaluate_object_transforms(object, object_export_frames)
+                temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes = sampled_transforms
+                
+                # Convert to export format
+                temp_rotation_keyframes = temp_rotation_keyframes * np.array((-1.0, 1.0, 1.0, 1.0), dtype=np.float32)
                 
-                # Export all frames starting from 0
-                for frame in range(0, int(action.frame_range[1]+1)):
-                    # Set the scene to this frame
-                    bpy.context.scene.frame_set(frame)
-                    
-                    # Force update
-                    depsgraph.update()
-                    
-                    # Get the evaluated object (this includes constraints, drivers, etc.)
-                    object_eval = object.evaluated_get(depsgraph)
-                    
-                    # Read matrix_basis - this is the object's local transform (independent of parent)
-                    # This is what the animator keyframes and what the ANI format expects
-                    local_matrix = object_eval.matrix_basis
-                    
-                    obj_animated_rotation = local_matrix.to_quaternion()
-                    obj_animated_position = local_matrix.to_translation()
-                    obj_animated_scale = local_matrix.to_scale()
-                    
-                    # Convert to export format
-                    temp_rotation_keyframes.append(Quaternion((-obj_animated_rotation.w, obj_animated_rotation.x, obj_animated_rotation.y, obj_animated_rotation.z)))
-                    temp_position_keyframes.append(obj_animated_position)
-                    temp_scale_keyframes.append(obj_animated_scale)
-                    
                 if object.type == "MESH":
                     mesh: bpy.types.Mesh = object.data
                     mesh_polygons = mesh.polygons
                     
                     # Group polygons by material (Logic must match msh.py)
-                    material_polygon_counts = {}
+                    polygon_amount = len(mesh_polygons)
+                    material_indices = np.empty(polygon_amount, dtype=np.int32)
+                    mesh_polygons.foreach_get("material_index", material_indices)
+                    loop_totals = np.empty(polygon_amount, dtype=np.int32)
+                    mesh_polygons.foreach_get("loop_total", loop_totals)
                     
-                    if not mesh_polygons:
-                        pass
-                    else:
-                        for poly in mesh_polygons:
-                            mat_idx = poly.material_index if poly.material_index < len(object.material_slots) else 0
-                            
-                            # Calculate indices for this polygon (triangulated)
-                            # 3 -> 3 indices
-                            # 4 -> 6 indices
-                            # n -> (n-2)*3 indices
-                            poly_indices_count = (len(poly.loop_indices) - 2) * 3
-                            
-                            if mat_idx not in material_polygon_counts:
-                                material_polygon_counts[mat_idx] = 0
-                            material_polygon_counts[mat_idx] += poly_indices_count
+                    material_indices[material_indices >= len(object.material_slots)] = 0
+                    
+                    # Calculate indices for each polygon (triangulated)
+                    # 3 -> 3 indices
+                    # 4 -> 6 indices
+                    # n -> (n-2)*3 indices
+                    material_polygon_counts = np.bincount(material_indices, weights=(loop_totals - 2) * 3).astype(np.int64)
 
                     # Iterate through groups and apply splitting logic
-                    # Sort keys to ensure deterministic order (though dicts are ordered in modern Python, explicit sort is safer for file stability)
-                    sorted_mat_indices = sorted(material_polygon_counts.keys())
+                    # flatnonzero returns the used material indices already sorted, which keeps the file order stable
+                    sorted_mat_indices = np.flatnonzero(material_polygon_counts).tolist()
                     
                     for mat_idx in sorted_mat_indices:
-                        indices_count = material_polygon_counts[mat_idx]
+                        indices_count = int(material_polygon_counts[mat_idx])
                         sub_object_base_name = object_name if mat_idx == 0 else f"{object_name}_{mat_idx}"
 
                         if indices_count <= 65535:
-                            add_object_animation_data(sub_object_base_name, total_frames, total_export_frames, temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes)
+                            add_object_animation_data([sub_object_base_name], total_frames, total_export_frames, temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes)
                         else:
                             print(f"Material Group {mat_idx} too large ({indices_count} indices). Splitting...")
                             maximum_split_amount = math.ceil(indices_count / 65535.0)
                             
-                            for split_number in range(0, maximum_split_amount):
-                                split_object_name = sub_object_base_name if split_number == 0 else f"{sub_object_base_name}_{split_number}"
-                                add_object_animation_data(split_object_name, total_frames, total_export_frames, temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes)
+                            split_object_names = [sub_object_base_name] + [f"{sub_object_base_name}_{split_number}" for split_number in range(1, maximum_split_amount)]
+                            add_object_animation_data(split_object_names, total_frames, total_export_frames, temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes)
                 elif object.type == "EMPTY":
                     # EMPTY objects export normally without splitting
-                    add_object_animation_data(object_name, total_frames, total_export_frames, temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes)
+                    add_object_animation_data([object_name], total_frames, total_export_frames, temp_rotation_keyframes, temp_position_keyframes, temp_scale_keyframes)
             
             # Export armature bone animations from this armature's slot in the action
             if object.type == "ARMATURE":
                 skeleton_data = SkeletonData(msg_handler)
                 skeleton_data.build_skeleton_from_armature(object, False)
                 
-                for bone_name in skeleton_data.bone_names:
-                    index = len(export_object_names)
-                    export_object_names.append(bone_name)
-                    export_unique_keyframe_counts.append(total_frames)
-                    export_maximum_frames.append(total_frames*FRAME_SCALE)
-                    export_rotation_keyframe_counts.append(total_export_frames)
-                    export_position_keyframe_counts.append(total_export_frames)
-                    export_scale_keyframe_counts.append(total_export_frames)
-                    export_unknown_keyframe_counts.append(0)
-                    
-                    bone_id = skeleton_data.bone_name_to_id[bone_name]
-                    pose_bone = object.pose.bones[bone_name]
+                pose_bones = object.pose.bones
+                
+                # MANUAL FRAME EVALUATION FOR BONES:
+                # Pose bone channels are read as they are stored, so constraints don't matter here, only drivers and NLA
+                sample_bone_fcurves = CBB_OT_ExportAni.can_sample_fcurves(object)
+                if sample_bone_fcurves:
+                    slot_fcurves = CBB_OT_ExportAni.get_slot_fcurves(action, object.animation_data.action_slot)
+                else:
+                    # The scene is evaluated once per frame for all bones together
+                    evaluated_bone_transforms = CBB_OT_ExportAni.evaluate_pose_bone_transforms(object, skeleton_data.bone_names, bone_export_frames)
+                
+                bone_amount = len(skeleton_data.bone_names)
+                first_bone_index = len(export_object_names)
+                export_object_names.extend(skeleton_data.bone_names)
+                export_unique_keyframe_counts.extend([total_frames] * bone_amount)
+                export_maximum_frames.extend([total_frames*FRAME_SCALE] * bone_amount)
+                export_rotation_keyframe_counts.extend([total_export_frames] * bone_amount)
+                export_position_keyframe_counts.extend([total_export_frames] * bone_amount)
+                export_scale_keyframe_counts.extend([total_export_frames] * bone_amount)
+                export_unknown_keyframe_counts.extend([0] * bone_amount)
+                
+                bone_name_to_id = skeleton_data.bone_name_to_id
+                bone_local_rotations = skeleton_data.bone_local_rotations
+                bone_local_positions = skeleton_data.bone_local_positions
+                bone_absolute_scales = skeleton_data.bone_absolute_scales
+                
+                for index, bone_name in enumerate(skeleton_data.bone_names, first_bone_index):
+                    bone_id = bone_name_to_id[bone_name]
+                    bone_local_rotation = bone_local_rotations[bone_id]
+                    bone_local_position = bone_local_positions[bone_id]
+                    pose_bone = pose_bones[bone_name]
                     
-                    temp_rotation_keyframes = []
-                    temp_position_keyframes = []
-                    temp_scale_keyframes = []
+                    if sample_bone_fcurves:
+                        rotations = CBB_OT_ExportAni.sample_fcurves(slot_fcurves, pose_bone.path_from_id("rotation_quaternion"), pose_bone.rotation_quaternion, bone_export_frames)
+                        positions = CBB_OT_ExportAni.sample_fcurves(slot_fcurves, pose_bone.path_from_id("location"), pose_bone.location, bone_export_frames)
+                        scales = CBB_OT_ExportAni.sample_fcurves(slot_fcurves, pose_bone.path_from_id("scale"), pose_bone.scale, bone_export_frames)
+                    else:
+                        rotations, positions, scales = evaluated_bone_transforms[bone_name]
                     
                     # Add binding pose as first keyframe (frame 0 in ANI format)
                     # For bones, we always use the skeleton's rest pose data
-                    obj_local_rot = skeleton_data.bone_local_rotations[bone_id]
-                    temp_rotation_keyframes.append(Quaternion((-obj_local_rot.w, obj_local_rot.x, obj_local_rot.y, obj_local_rot.z)))
-                    temp_position_keyframes.append(skeleton_data.bone_local_positions[bone_id])
-                    temp_scale_keyframes.append(skeleton_data.bone_absolute_scales[bone_id])
+                    rotations = np.vstack((np.array(bone_local_rotation, dtype=np.float32), Utils.get_world_rotations_array(bone_local_rotation, rotations)))
+                    positions = np.vstack((np.array(bone_local_position, dtype=np.float32), Utils.get_world_positions_array(bone_local_position, bone_local_rotation, positions)))
+                    scales = np.vstack((np.array(bone_absolute_scales[bone_id], dtype=np.float32), scales))
                     
-                    # MANUAL FRAME EVALUATION FOR BONES:
-                    # Export animation frames starting from frame 1
-                    depsgraph = bpy.context.evaluated_depsgraph_get()
+                    # Convert to export format
+                    rotations *= np.array((-1.0, 1.0, 1.0, 1.0), dtype=np.float32)
                     
-                    for frame in range(1, int(action.frame_range[1]+1)):
-                        # Set the scene to this frame
-                        bpy.context.scene.frame_set(frame)
-                        
-                        # Force update
-                        depsgraph.update()
-                        
-                        # Get the evaluated armature (includes constraints, drivers, etc.)
-                        object_eval = object.evaluated_get(depsgraph)
-                        pose_bone_eval = object_eval.pose.bones[bone_name]
-                        
-                        pose_bone_rotation = pose_bone_eval.rotation_quaternion.copy()
-                        local_animated_rotation = Utils.get_world_rotation(skeleton_data.bone_local_rotations[bone_id], pose_bone_rotation)
-                        temp_rotation_keyframes.append(Quaternion((-local_animated_rotation.w, local_animated_rotation.x, local_animated_rotation.y, local_animated_rotation.z)))
-                        
-                        pose_bone_position = pose_bone_eval.location.copy()
-                        local_animated_position = Utils.get_world_position(skeleton_data.bone_local_positions[bone_id], skeleton_data.bone_local_rotations[bone_id], pose_bone_position)
-                        temp_position_keyframes.append(local_animated_position)
-                        
-                        obj_animated_scale = pose_bone_eval.scale.copy()
-                        temp_scale_keyframes.append(obj_animated_scale)
-                        
-                    export_rotation_keyframes[index] = temp_rotation_keyframes
-                    export_position_keyframes[index] = temp_position_keyframes
-                    export_scale_keyframes[index] = temp_scale_keyframes
+                    export_rotation_keyframes[index] = rotations
+                    export_position_keyframes[index] = positions
+                    export_scale_keyframes[index] = scales
                     
         
         co_conv = Utils.CoordinatesConverter(CoordsSys.Blender, CoordsSys._3DSMax)
-        with open(filepath, 'wb') as file:
+        # The whole file is serialized in memory and written to disk at once
+        with io.BytesIO() as file:
             writer = Utils.Serializer(file, Utils.Serializer.Endianness.Little, Utils.Serializer.Quaternion_Order.XYZW, Utils.Serializer.Matrix_Order.ColumnMajor, co_conv)
+            # Names are encoded once up front, the header struct pads them to the fixed-size name field
+            encoded_object_names = [object_name.encode("euc-kr") for object_name in export_object_names]
+            # Every block starts at frame 0, so the scaled frame numbers are shared by all of them
+            scaled_frames = np.arange(total_export_frames, dtype=np.uint32) * FRAME_SCALE
             writer.write_ushort(len(export_object_names))
-            for index, object_name in enumerate(export_object_names):
-                writer.write_fixed_string(100, "euc-kr", object_name)
-                writer.write_ushort(export_unique_keyframe_counts[index])
-                writer.write_ushort(export_maximum_frames[index])
-                file.write(bytearray(36))
+            for index, encoded_object_name in enumerate(encoded_object_names):
+                file.write(OBJECT_HEADER_STRUCT.pack(encoded_object_name, export_unique_keyframe_counts[index], export_maximum_frames[index]))
                 
                 exporting_rotation_keyframes = export_rotation_keyframes.get(index)
                 writer.write_ushort(export_rotation_keyframe_counts[index])
                 if exporting_rotation_keyframes is not None:
-                    for frame_number, rotation in enumerate(exporting_rotation_keyframes):
-                        writer.write_converted_quaternion(rotation)
-                        writer.write_uint(frame_number*FRAME_SCALE)
+                    # Keyframes stay as (w, x, y, z) arrays until here; the file stores them as XYZW
+                    converted_rotations = co_conv.convert_quaternion_array(np.asarray(exporting_rotation_keyframes, dtype=np.float32))
+                    file.write(CBB_OT_ExportAni.pack_keyframes(ROTATION_KEYFRAME_DTYPE, converted_rotations[:, [1, 2, 3, 0]], scaled_frames))
                 
                 exporting_position_keyframes = export_position_keyframes.get(index)
                 writer.write_ushort(export_position_keyframe_counts[index])
                 if exporting_position_keyframes is not None:
-                    for frame_number, position in enumerate(exporting_position_keyframes):
-                        writer.write_converted_vector3f(position)
-                        writer.write_uint(frame_number*FRAME_SCALE)
+                    file.write(CBB_OT_ExportAni.pack_keyframes(VECTOR_KEYFRAME_DTYPE, co_conv.convert_vector3f_array(np.asarray(exporting_position_keyframes, dtype=np.float32)), scaled_frames))
                 
                 exporting_scale_keyframes = export_scale_keyframes.get(index)
                 writer.write_ushort(export_scale_keyframe_counts[index])
                 if exporting_scale_keyframes is not None:
-                    for frame_number, scale in enumerate(exporting_scale_keyframes):
-                        writer.write_vector3f(scale)
-                        writer.write_uint(frame_number*FRAME_SCALE)
+                    file.write(CBB_OT_ExportAni.pack_keyframes(VECTOR_KEYFRAME_DTYPE, exporting_scale_keyframes, scaled_frames))
                 
                 exporting_unknown_keyframes = export_unknown_keyframes.get(index)
                 writer.write_ushort(export_unknown_keyframe_counts[index])
                 if exporting_unknown_keyframes is not None:
-                    for frame_number, unknown in enumerate(exporting_unknown_keyframes):
-                        writer.write_float(unknown)
-                        writer.write_uint(frame_number*FRAME_SCALE)
-        
-        # Restore previous state
-        bpy.context.scene.frame_set(old_frame)
+                    file.write(CBB_OT_ExportAni.pack_keyframes(FLOAT_KEYFRAME_DTYPE, exporting_unknown_keyframes, scaled_frames))
+            
+            with open(filepath, 'wb') as opened_file:
+                opened_file.write(file.getbuffer())
         
-        # Restore old actions
+        # Restore old actions first, so the single frame_set below evaluates the scene only once with them
         for obj, old_action in old_actions.items():
-            if obj.animation_data:
+            if obj.animation_data and obj.animation_data.action != old_action:
                 obj.animation_data.action = old_action
         
+        # Restore previous state
+        bpy.context.scene.frame_set(old_frame)
+        
         # Restore selection and mode
         bpy.ops.object.select_all(action='DESELECT')
         
@@ -17,8 +17,58 @@ from .bn_skeleton import SkeletonData
 import random
 from pathlib import Path
 import bmesh
+import functools
+import hashlib
+import io
+import mmap
 from .rf_shared import RFShared
 from . import texture_utils
+import numpy as np
+
+# MESH08 vertex record: position, three weights (the fourth is implied), four bone indices, normal, uv and an unused vector
+MESH08_VERTEX_DTYPE = np.dtype([
+    ("position", "<f4", 3),
+    ("weights", "<f4", 3),
+    ("bone_indices", "<u2", 4),
+    ("normal", "<f4", 3),
+    ("uv", "<f4", 2),
+    ("binormal", "<f4", 3),
+])
+
+# Default mesh vertex record: position, a float that is always 1.0, then normal
+DEFAULT_VERTEX_DTYPE = np.dtype([
+    ("position", "<f4", 3),
+    ("unknown", "<f4"),
+    ("normal", "<f4", 3),
+])
+
+# Default mesh triangle record: vertex indices, one normal and one uv per corner (only the first two floats are used), then four unknown bytes
+DEFAULT_TRIANGLE_DTYPE = np.dtype([
+    ("indices", "<u4", 3),
+    ("normals", "<f4", (3, 3)),
+    ("uvs", "<f4", (3, 3)),
+    ("unknown", "V4"),
+])
+
+# Default mesh weight records: vertex index, weight amount, then four bone indices (-1 for none) or four fixed bone names, then four weights
+DEFAULT_INDEXED_WEIGHT_DTYPE = np.dtype([
+    ("vertex_index", "<u4"),
+    ("weight_amount", "<u4"),
+    ("bone_indices", "<i4", 4),
+    ("weights", "<f4", 4),
+])
+DEFAULT_NAMED_WEIGHT_STRUCT = struct.Struct("<II100s100s100s100s4f")
+
+# MSH object header, everything before the vertex data: name, parent name, world matrix (column major), unused local and third matrices,
+# vertex/triangle/weight amounts, texture and effect paths, bounding box max and min, unknown values, weight model type, more unknown values
+MSH_OBJECT_HEADER_STRUCT = struct.Struct("<100s100s16f128xHHH100s100s3f3f3f2II3ff31x")
+
+# RFS archive table entry: euc-kr file name, then offset and size of the file inside the archive
+RFS_ENTRY_DTYPE = np.dtype([
+    ("name", "S56"),
+    ("offset", "<u4"),
+    ("size", "<u4"),
+])
 
 class CBB_OT_ImportMSH(Operator, ImportHelper):
     bl_idname = "cbb.msh_import"
@@ -62,6 +112,7 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
         Find a direct child directory of `parent` whose name matches `target_name`
         case-insensitively. Returns the actual on-disk path (original casing), or None.
         """
+        # Casefolded once, each directory entry is then casefolded a single time
         target_lower = target_name.casefold()
         try:
             for entry in os.scandir(parent):
@@ -81,11 +132,12 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
         if not start_path:
             return ""
 
-        current_path = start_path
+        # Made absolute once, each level up is then just the parent
+        current_path = Path(os.path.abspath(start_path))
         for _ in range(max_levels):
-            current_path = os.path.abspath(os.path.join(current_path, os.pardir))
+            current_path = current_path.parent
             # Walk down each segment of target_dir case-insensitively
-            resolved = current_path
+            resolved = str(current_path)
             for segment in target_dir:
                 found = CBB_OT_ImportMSH.find_child_dir_icase(resolved, segment)
                 if found is None:
@@ -96,17 +148,157 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
                 return resolved
         return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def decode_fixed_name(raw_name: bytes) -> str:
+        """
+        Decodes a null padded euc-kr name. Cached by the raw bytes, since the same bone names repeat for many vertices.
+        """
+        return raw_name.partition(b"\x00")[0].decode("euc-kr")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def get_rfs_index(archive_stats: tuple[tuple[str, float, int], ...]) -> dict[str, tuple[str, int, int]]:
+        """
+        Reads the entry tables of the given .rfs archives once. Returns a dictionary of casefolded entry name stems
+        to (archive path, offset, size), keeping the first archive given for each name.
+        archive_stats holds the (path, mtime, size) of every archive, see get_rfs_archive_stats. The mtimes and sizes are
+        only part of the cache key, so the index is rebuilt whenever an archive is replaced or repacked.
+        """
+        rfs_index = {}
+        for full_file_path, _, _ in archive_stats:
+            with open(full_file_path, "rb") as opened_file:
+                file_count = struct.unpack("<I", opened_file.read(4))[0]
+                entries = np.frombuffer(opened_file.read(file_count * RFS_ENTRY_DTYPE.itemsize), dtype=RFS_ENTRY_DTYPE)
+            
+            for raw_name, file_offset, file_size in zip(entries["name"].tolist(), entries["offset"].tolist(), entries["size"].tolist()):
+                # Anything after the first NUL is leftover data, not part of the name
+                entry_name = raw_name.partition(b"\x00")[0].decode("euc-kr")
+                rfs_index.setdefault(os.path.splitext(entry_name)[0].casefold(), (full_file_path, file_offset, file_size))
+        return rfs_index
+
+    @staticmethod
+    def get_rfs_archive_stats(textures_folder: str) -> tuple[tuple[str, float, int], ...]:
+        """
+        (path, mtime, size) of every .rfs archive in textures_folder, in listing order. Used as the key of get_rfs_index.
+        """
+        archive_stats = []
+        with os.scandir(textures_folder) as entries:
+            for entry in entries:
+                if entry.name.casefold().endswith('.rfs'):
+                    entry_stat = entry.stat()
+                    archive_stats.append((entry.path, entry_stat.st_mtime, entry_stat.st_size))
+        return tuple(archive_stats)
+
+    @staticmethod
+    def get_directory_file_index(directory: str, max_depth) -> dict[str, list[tuple[str, str]]]:
+        """
+        Scans directory once, descending at most max_depth levels (None for no limit). Returns a dictionary of casefolded
+        file stems to their (path, casefolded extension) pairs, in the same order os.walk would visit them.
+        The index is built once per import through find_texture_sources, so files added between imports are always found.
+        """
+        file_index = {}
+        pending_directories = [(directory, 0)]
+        while pending_directories:
+            current_directory, depth = pending_directories.pop()
+            # Subdirectories past max_depth are pruned here instead of being queued and skipped
+            descend = max_depth is None or depth + 1 < max_depth
+            
+            child_directories = []
+            try:
+                with os.scandir(current_directory) as entries:
+                    for entry in entries:
+                        # Symlinked directories are not followed, same as os.walk
+                        if entry.is_dir(follow_symlinks=False):
+                            if descend:
+                                child_directories.append(entry.path)
+                        elif entry.is_file():
+                            file_stem, file_ext = os.path.splitext(entry.name)
+                            file_index.setdefault(file_stem.casefold(), []).append((entry.path, file_ext.casefold()))
+            except OSError:
+                continue
+            
+            # Pushed in reverse so subdirectories are visited in listing order, like a top-down os.walk
+            pending_directories.extend((child_directory, depth + 1) for child_directory in reversed(child_directories))
+        return file_index
+
+    @staticmethod
     def find_texture_in_directory(target_directory, mesh_name, possible_extensions=[".png", ".jpg", ".jpeg", ".bmp", ".tga", ".dds"]):
-        for root, dirs, files in os.walk(target_directory):
-            for file in files:
-                for ext in possible_extensions:
-                    if file.casefold() == (mesh_name + ext).casefold():
-                        return os.path.join(root, file)
+        wanted_extensions = tuple(ext.casefold() for ext in possible_extensions)
+        wanted_stem = mesh_name.casefold()
+        # Files of a directory are checked before its subdirectories, like os.walk, and the scan stops at the first match
+        pending_directories = [target_directory]
+        while pending_directories:
+            child_directories = []
+            try:
+                with os.scandir(pending_directories.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            child_directories.append(entry.path)
+                        else:
+                            # One C level endswith rejects most files before the name is split
+                            entry_name = entry.name.casefold()
+                            if entry_name.endswith(wanted_extensions) and os.path.splitext(entry_name)[0] == wanted_stem and entry.is_file():
+                                return entry.path
+            except OSError:
+                continue
+            pending_directories.extend(reversed(child_directories))
         return None
     
-    def get_texture_as_image(self, mesh_file_path, texture_name: str, target_dir, max_levels) -> tuple:
+    def find_texture_sources(self, mesh_file_path, max_levels) -> tuple:
         """
-        Get texture as Blender image and optionally analyze alpha.
+        Resolve where textures for meshes inside mesh_file_path can be found. Only depends on the path,
+        so it's done once and shared by every texture lookup.
+        
+        Returns:
+            tuple: (loose files index of the Tex folder, RFS index of the Tex folder, fallback index of the mesh folder)
+                - Each of them is None when that source isn't available
+        """
+        # Normalized once, each level up is then just the parent
+        mesh_directory = Path(os.path.abspath(mesh_file_path))
+
+        # Traverse up to max_levels to find the "mesh" directory (case-insensitive)
+        for _ in range(max_levels):
+            if mesh_directory.name.casefold() == "mesh":
+                break
+            if mesh_directory.parent == mesh_directory:  # Root directory reached
+                break
+            mesh_directory = mesh_directory.parent
+
+        # Guard: if we ended up at the filesystem root, don't search from there
+        if mesh_directory.parent == mesh_directory:
+            print(f"    Cannot locate 'mesh' parent directory; search stopped at filesystem root.")
+            return None, None, None
+        
+        mesh_file_path = str(mesh_directory)
+
+        textures_folder_index = None
+        rfs_index = None
+        
+        # Locate the sibling Tex folder using case-insensitive lookup
+        parent_dir = str(mesh_directory.parent)
+        textures_folder = CBB_OT_ImportMSH.find_child_dir_icase(parent_dir, "Tex")
+        if textures_folder is None:
+            self.report({"INFO"}, f"Textures folder not found near: {parent_dir}")
+        else:
+            textures_folder_index = CBB_OT_ImportMSH.get_directory_file_index(textures_folder, None)
+            try:
+                rfs_index = CBB_OT_ImportMSH.get_rfs_index(CBB_OT_ImportMSH.get_rfs_archive_stats(textures_folder))
+            except (OSError, IOError) as e:
+                self.report({"ERROR"}, f"Error while reading RFS files in [{textures_folder}]: {e}")
+                traceback.print_exc()
+        
+        # If no texture is found in the Tex folder, the mesh file path is searched for ANY matching file name.
+        # This can find even .png or other texture formats, but is limited by depth.
+        MAX_FALLBACK_DEPTH = 4
+        fallback_index = CBB_OT_ImportMSH.get_directory_file_index(mesh_file_path, MAX_FALLBACK_DEPTH)
+        
+        return textures_folder_index, rfs_index, fallback_index
+    
+    def get_texture_as_image(self, texture_name: str, texture_sources: tuple, texture_cache: dict) -> tuple:
+        """
+        Get texture as Blender image and optionally analyze alpha, searching the sources given by find_texture_sources.
+        DDS textures are also kept in texture_cache by content hash, so identical data under another name reuses the loaded image.
         
         Returns:
             tuple: (bpy.types.Image, dict or None) 
@@ -115,7 +307,7 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
                 - If not found: (None, None)
         """
         
-        print(f"Attempting to get texture at path: {mesh_file_path}{texture_name}")
+        print(f"Attempting to get texture: {texture_name}")
         
         # Check if material already exists - if so, we don't need to do anything
         material_name = f"Mat_{texture_name}"
@@ -149,173 +341,191 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
                 'binary_percentage': 0.0
             }
 
-        # Normalize mesh file path
-        mesh_file_path = os.path.normpath(mesh_file_path)
-
-        # Filesystem root — used to detect when traversal has gone too far
-        FS_ROOT = os.path.abspath(os.sep)
-
-        # Traverse up to max_levels to find the "mesh" directory (case-insensitive)
-        for _ in range(max_levels):
-            if os.path.basename(mesh_file_path).casefold() == "mesh":
-                break
-            parent_path = os.path.dirname(mesh_file_path)
-            if parent_path == mesh_file_path:  # Root directory reached
-                break
-            mesh_file_path = parent_path
-
-        # Guard: if we ended up at the filesystem root, don't search from there
-        if os.path.normpath(mesh_file_path) == FS_ROOT:
-            print(f"    Cannot locate 'mesh' parent directory; search stopped at filesystem root.")
-            return None, None
-
-        target_filename_stem = os.path.splitext(texture_name)[0]
-        target_filename_stem_lower = target_filename_stem.casefold()
-
-        # Locate the sibling Tex folder using case-insensitive lookup
-        parent_dir = os.path.dirname(mesh_file_path)
-        textures_folder = CBB_OT_ImportMSH.find_child_dir_icase(parent_dir, "Tex")
-        if textures_folder is None:
-            self.report({"INFO"}, f"Textures folder not found near: {parent_dir}")
+        textures_folder_index, rfs_index, fallback_index = texture_sources
+        
+        target_filename_stem_lower = os.path.splitext(texture_name)[0].casefold()
 
-        if textures_folder is not None:
+        if textures_folder_index is not None:
             # Search for loose .dds files
-            for root, _, files_in_dir in os.walk(textures_folder):
-                for found_file in files_in_dir:
-                    found_file_stem, found_file_ext = os.path.splitext(found_file)
-                    if found_file_stem.casefold() == target_filename_stem_lower:
-                        if found_file_ext.casefold() == ".dds":
-                            full_texture_path = os.path.join(root, found_file)
-
-                            # Analyze BEFORE loading into Blender
-                            try:
-                                alpha_analysis = texture_utils.analyze_dds_alpha(full_texture_path)
-                            except Exception as e:
-                                print(f"    Warning: Alpha analysis failed: {e}")
-                                alpha_analysis = {'mode': 'BLEND', 'threshold': 0.5, 'has_alpha': False}
-
-                            # Now load the texture
-                            try:
-                                print(f"    Attempt succeeded: texture loaded from loose file in disk.")
-                                blender_image = bpy.data.images.load(full_texture_path, check_existing=True)
-                                blender_image.pack()
-                                return blender_image, alpha_analysis
-                            except RuntimeError as e:
-                                self.report({"WARNING"}, f"Found texture file '{full_texture_path}' but failed to load: {e}")
-                            except Exception as e:
-                                self.report({"ERROR"}, f"Unexpected error loading loose texture '{full_texture_path}': {e}")
-                                traceback.print_exc()
-                                return None, None
-
-            # List all .rfs files in the textures folder
-            rfs_files = [file for file in os.listdir(textures_folder) if file.casefold().endswith('.rfs')]
+            for full_texture_path, found_file_ext in textures_folder_index.get(target_filename_stem_lower, ()):
+                if found_file_ext == ".dds":
+                    try:
+                        with open(full_texture_path, "rb") as texture_file:
+                            dds_data = texture_file.read()
+                    except OSError as e:
+                        self.report({"WARNING"}, f"Found texture file '{full_texture_path}' but failed to read it: {e}")
+                        continue
+                    
+                    content_hash = hashlib.sha1(dds_data).digest()
+                    if content_hash in texture_cache:
+                        print(f"    Attempt succeeded: identical texture data was already loaded.")
+                        return texture_cache[content_hash]
+                    
+                    # Analyze BEFORE loading into Blender
+                    try:
+                        alpha_analysis = texture_utils.analyze_dds_alpha_bytes(dds_data)
+                    except Exception as e:
+                        print(f"    Warning: Alpha analysis failed: {e}")
+                        alpha_analysis = {'mode': 'BLEND', 'threshold': 0.5, 'has_alpha': False}
 
-            for file_path in rfs_files:
+                    # Now load the texture
+                    try:
+                        print(f"    Attempt succeeded: texture loaded from loose file in disk.")
+                        blender_image = bpy.data.images.load(full_texture_path, check_existing=True)
+                        blender_image.pack()
+                        texture_cache[content_hash] = (blender_image, alpha_analysis)
+                        return blender_image, alpha_analysis
+                    except RuntimeError as e:
+                        self.report({"WARNING"}, f"Found texture file '{full_texture_path}' but failed to load: {e}")
+                    except Exception as e:
+                        self.report({"ERROR"}, f"Unexpected error loading loose texture '{full_texture_path}': {e}")
+                        traceback.print_exc()
+                        return None, None
+
+        if rfs_index is not None:
+            rfs_entry = rfs_index.get(target_filename_stem_lower)
+            if rfs_entry is not None:
+                full_file_path, file_offset, file_size = rfs_entry
                 try:
-                    full_file_path = os.path.join(textures_folder, file_path)
                     with open(full_file_path, "rb") as opened_file:
-                        file_count = struct.unpack("<I", opened_file.read(4))[0]
-
-                        for _ in range(file_count):
-                            file_name = opened_file.read(56).split(b"\x00")[0].decode("euc-kr")
-                            file_offset = struct.unpack("<I", opened_file.read(4))[0]
-                            file_size = struct.unpack("<I", opened_file.read(4))[0]
-                            
-                            if os.path.splitext(file_name)[0].casefold() == os.path.splitext(texture_name)[0].casefold():
-                                opened_file.seek(file_offset, 0)
-                                dds_header = bytearray(opened_file.read(128))
-
-                                # Decrypt header if needed
-                                if dds_header[:4] != b'DDS ':
-                                    dds_header = RFShared.unlock_dds(list(struct.unpack('<32I', dds_header)))
-                                    dds_header = struct.pack('<32I', *dds_header)
-
-                                # Read texture data
-                                texture_data = opened_file.read(file_size - 128)
-
-                                # Create temporary file for analysis
-                                temp_file = tempfile.NamedTemporaryFile(suffix=".dds", delete=False)
-                                temp_file.write(dds_header)
-                                temp_file.write(texture_data)
-                                temp_file.flush()
-                                temp_file.close()
-                                
-                                # Analyze the temp file
-                                try:
-                                    alpha_analysis = texture_utils.analyze_dds_alpha(temp_file.name)
-                                except Exception as e:
-                                    print(f"    Warning: Alpha analysis failed: {e}")
-                                    alpha_analysis = {'mode': 'BLEND', 'threshold': 0.5, 'has_alpha': False}
-                                
-                                # Load into Blender
-                                blender_image = bpy.data.images.load(temp_file.name)
-                                blender_image.name = texture_name
-                                blender_image.pack()
-                                
-                                # Clean up temp file
-                                try:
-                                    os.remove(temp_file.name)
-                                except:
-                                    pass
-                                
-                                print(f"    Attempt succeeded: texture loaded from inside RFS files.")
-                                
-                                return blender_image, alpha_analysis
+                        opened_file.seek(file_offset, 0)
+                        dds_header = bytearray(opened_file.read(128))
+
+                        # Decrypt header if needed
+                        if dds_header[:4] != b'DDS ':
+                            dds_header = RFShared.unlock_dds_header(dds_header)
+
+                        # Read texture data
+                        texture_data = opened_file.read(file_size - 128)
+
+                    # Analyze straight from memory, the temporary file is only needed by Blender's image loader
+                    dds_data = bytes(dds_header) + texture_data
+                    content_hash = hashlib.sha1(dds_data).digest()
+                    if content_hash in texture_cache:
+                        print(f"    Attempt succeeded: identical texture data was already loaded.")
+                        return texture_cache[content_hash]
+                    
+                    try:
+                        alpha_analysis = texture_utils.analyze_dds_alpha_bytes(dds_data)
+                    except Exception as e:
+                        print(f"    Warning: Alpha analysis failed: {e}")
+                        alpha_analysis = {'mode': 'BLEND', 'threshold': 0.5, 'has_alpha': False}
+                    
+                    temp_file = tempfile.NamedTemporaryFile(suffix=".dds", delete=False)
+                    temp_file.write(dds_data)
+                    temp_file.close()
+                    
+                    # Load into Blender
+                    blender_image = bpy.data.images.load(temp_file.name)
+                    blender_image.name = texture_name
+                    blender_image.pack()
+                    
+                    # Clean up temp file
+                    try:
+                        os.remove(temp_file.name)
+                    except:
+                        pass
+                    
+                    print(f"    Attempt succeeded: texture loaded from inside RFS files.")
+                    
+                    texture_cache[content_hash] = (blender_image, alpha_analysis)
+                    return blender_image, alpha_analysis
 
                 except (OSError, IOError) as e:
-                    self.report({"ERROR"}, f"Error while opening file at [{file_path}]: {e}")
+                    self.report({"ERROR"}, f"Error while opening file at [{full_file_path}]: {e}")
                     traceback.print_exc()
                     return None, None
             
-        # If no texture found yet, search in the mesh file path for ANY matching file name.
-        # This can find even .png or other texture formats, but is limited by depth.
-        search_dir = mesh_file_path
-
-        # Safety guard: never walk from the filesystem root
-        if os.path.normpath(search_dir) == FS_ROOT:
-            print(f"    Fallback: search_dir resolved to filesystem root, skipping broad scan.")
+        # If no texture found yet, use ANY matching file name in the mesh file path
+        if fallback_index is None:
             return None, None
+        
+        print(f"    Fallback: Searching in the mesh folder for ANY match for {texture_name}")
 
-        MAX_FALLBACK_DEPTH = 4
-        print(f"    Fallback: Searching in {search_dir} (max depth {MAX_FALLBACK_DEPTH}) for ANY match for {target_filename_stem}")
+        for full_texture_path, found_file_ext in fallback_index.get(target_filename_stem_lower, ()):
+            # Found a match with ANY extension
 
-        for root, dirs, files_in_dir in os.walk(search_dir):
-            # Enforce depth limit to avoid massive scans
-            depth = root[len(search_dir):].count(os.sep)
-            if depth >= MAX_FALLBACK_DEPTH:
-                dirs[:] = []  # stop descending further
-                continue
+            # If it's DDS, analyze alpha; otherwise assume opaque
+            if found_file_ext == ".dds":
+                try:
+                    alpha_analysis = texture_utils.analyze_dds_alpha(full_texture_path)
+                except Exception as e:
+                    print(f"    Warning: Alpha analysis failed: {e}")
+                    alpha_analysis = {'mode': 'BLEND', 'threshold': 0.5, 'has_alpha': False}
+            else:
+                alpha_analysis = {'mode': 'OPAQUE', 'threshold': 0.5, 'has_alpha': False}
+
+            try:
+                print(f"    Fallback succeeded: texture loaded from {full_texture_path}")
+                blender_image = bpy.data.images.load(full_texture_path, check_existing=True)
+                blender_image.pack()
+                return blender_image, alpha_analysis
+            except RuntimeError as e:
+                self.report({"WARNING"}, f"Found fallback texture '{full_texture_path}' but failed to load: {e}")
+            except Exception as e:
+                print(f"    Error loading fallback texture '{full_texture_path}': {e}")
 
-            for found_file in files_in_dir:
-                found_file_stem, found_file_ext = os.path.splitext(found_file)
-                if found_file_stem.casefold() == target_filename_stem_lower:
-                    # Found a match with ANY extension
-                    full_texture_path = os.path.join(root, found_file)
+        return None, None
+    
+    @staticmethod
+    def get_material_template(alpha_mode: str, material_templates: dict) -> bpy.types.Material:
+        """
+        Returns the template material with the node setup of the given alpha mode, creating it on first use.
+        Templates are stored in material_templates and only live during one import.
+        """
+        template = material_templates.get(alpha_mode)
+        if template is not None:
+            return template
+        
+        template = bpy.data.materials.new(name=f".CBB_Template_{alpha_mode}")
+        template.use_nodes = True
+        nodes = template.node_tree.nodes
+        links = template.node_tree.links
+        bsdf = nodes["Principled BSDF"]
 
-                    # If it's DDS, analyze alpha; otherwise assume opaque
-                    if found_file_ext.casefold() == ".dds":
-                        try:
-                            alpha_analysis = texture_utils.analyze_dds_alpha(full_texture_path)
-                        except Exception as e:
-                            print(f"    Warning: Alpha analysis failed: {e}")
-                            alpha_analysis = {'mode': 'BLEND', 'threshold': 0.5, 'has_alpha': False}
-                    else:
-                        alpha_analysis = {'mode': 'OPAQUE', 'threshold': 0.5, 'has_alpha': False}
+        tex_image = nodes.new("ShaderNodeTexImage")
+        tex_image.name = "Image Texture"
 
-                    try:
-                        print(f"    Fallback succeeded: texture loaded from {full_texture_path}")
-                        blender_image = bpy.data.images.load(full_texture_path, check_existing=True)
-                        blender_image.pack()
-                        return blender_image, alpha_analysis
-                    except RuntimeError as e:
-                        self.report({"WARNING"}, f"Found fallback texture '{full_texture_path}' but failed to load: {e}")
-                    except Exception as e:
-                        print(f"    Error loading fallback texture '{full_texture_path}': {e}")
+        links.new(bsdf.inputs["Base Color"], tex_image.outputs["Color"])
 
-        return None, None
+        specular_value = nodes.new(type="ShaderNodeValue")
+        specular_value.outputs[0].default_value = 0.0
+        links.new(specular_value.outputs[0], bsdf.inputs['Specular IOR Level'])
+        
+        if alpha_mode == 'OPAQUE':
+            template.blend_method = 'OPAQUE'
+            
+        elif alpha_mode == 'MASK':
+            template.blend_method = 'CLIP'
+            
+            # Set up math nodes for glTF export compatibility, the threshold is set per material
+            less_than = nodes.new('ShaderNodeMath')
+            less_than.name = "Less Than"
+            less_than.operation = 'LESS_THAN'
+            less_than.location = (tex_image.location.x + 300, tex_image.location.y - 200)
+            
+            subtract = nodes.new('ShaderNodeMath')
+            subtract.operation = 'SUBTRACT'
+            subtract.inputs[0].default_value = 1.0
+            subtract.location = (less_than.location.x + 200, less_than.location.y)
+            
+            alpha_socket = bsdf.inputs.get('Alpha')
+            if alpha_socket:
+                links.new(tex_image.outputs["Alpha"], less_than.inputs[0])
+                links.new(less_than.outputs[0], subtract.inputs[1])
+                links.new(subtract.outputs[0], alpha_socket)
+            
+        else:  # BLEND
+            template.blend_method = 'BLEND'
+            links.new(bsdf.inputs["Alpha"], tex_image.outputs["Alpha"])
+        
+        template.use_transparency_overlap = False
+        
+        material_templates[alpha_mode] = template
+        return template
     
     @staticmethod
-    def apply_texture_to_mesh(mesh_obj, texture_image, texture_name: str, alpha_analysis: dict):
+    def apply_texture_to_mesh(mesh_obj, texture_image, texture_name: str, alpha_analysis: dict, material_templates: dict):
         """
         Apply texture to mesh with intelligent alpha mode selection.
         
@@ -324,6 +534,7 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
             texture_image: The texture image (can be None if material already exists)
             texture_name: Name of the texture for material lookup
             alpha_analysis: Dict with alpha analysis results (can be None if material exists)
+            material_templates: Template materials of the current import, see get_material_template
         """
         material_name = f"Mat_{texture_name}"
         
@@ -349,61 +560,26 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
         if alpha_analysis is None:
             alpha_analysis = {'mode': 'OPAQUE', 'threshold': 0.5, 'has_alpha': False}
         
-        # Create new material
-        mat = bpy.data.materials.new(name=material_name)
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes["Principled BSDF"]
-
-        tex_image = mat.node_tree.nodes.new("ShaderNodeTexImage")
-        tex_image.image = texture_image
-
-        mat.node_tree.links.new(bsdf.inputs["Base Color"], tex_image.outputs["Color"])
-
-        specular_value = mat.node_tree.nodes.new(type="ShaderNodeValue")
-        specular_value.outputs[0].default_value = 0.0
-        mat.node_tree.links.new(specular_value.outputs[0], bsdf.inputs['Specular IOR Level'])
-        
         # Apply alpha mode based on analysis
         alpha_mode = alpha_analysis.get('mode', 'OPAQUE')
         
+        # Create new material from the template of its alpha mode, so only the per texture values are set here
+        mat = CBB_OT_ImportMSH.get_material_template(alpha_mode, material_templates).copy()
+        mat.name = material_name
+        mat.node_tree.nodes["Image Texture"].image = texture_image
+        
         if alpha_mode == 'OPAQUE':
-            mat.blend_method = 'OPAQUE'
             print(f"  Material '{material_name}' set to OPAQUE mode")
             
         elif alpha_mode == 'MASK':
-            mat.blend_method = 'CLIP'
             threshold = alpha_analysis.get('threshold', 0.5)
             mat.alpha_threshold = threshold
-            
-            # Set up math nodes for glTF export compatibility
-            nodes = mat.node_tree.nodes
-            links = mat.node_tree.links
-            
-            less_than = nodes.new('ShaderNodeMath')
-            less_than.operation = 'LESS_THAN'
-            less_than.inputs[1].default_value = threshold
-            less_than.location = (tex_image.location.x + 300, tex_image.location.y - 200)
-            
-            subtract = nodes.new('ShaderNodeMath')
-            subtract.operation = 'SUBTRACT'
-            subtract.inputs[0].default_value = 1.0
-            subtract.location = (less_than.location.x + 200, less_than.location.y)
-            
-            alpha_socket = bsdf.inputs.get('Alpha')
-            if alpha_socket:
-                links.new(tex_image.outputs["Alpha"], less_than.inputs[0])
-                links.new(less_than.outputs[0], subtract.inputs[1])
-                links.new(subtract.outputs[0], alpha_socket)
-            
+            mat.node_tree.nodes["Less Than"].inputs[1].default_value = threshold
             print(f"  Material '{material_name}' set to MASK mode with threshold {threshold:.3f}")
             
         else:  # BLEND
-            mat.blend_method = 'BLEND'
-            mat.node_tree.links.new(bsdf.inputs["Alpha"], tex_image.outputs["Alpha"])
             print(f"  Material '{material_name}' set to BLEND mode")
         
-        mat.use_transparency_overlap = False
-        
         if mesh_obj.data.materials:
             mesh_obj.data.materials[0] = mat
         else:
@@ -415,417 +591,453 @@ class CBB_OT_ImportMSH(Operator, ImportHelper):
 
     def import_meshes(self, context):
         msg_handler = Utils.MessageHandler(self.debug, self.report)
+        # Result of get_texture_as_image by texture path, including textures that weren't found
+        texture_lookups = {}
+        # DDS images loaded during this import by content hash
+        texture_cache = {}
+        # Materials are copied from these, they are removed once the import is done
+        material_templates = {}
+        # All files come from self.directory, so the texture folders are resolved on the first lookup and shared by every file
+        texture_sources = None
         
-        for file in self.files:
-            if file.name.casefold().endswith(".msh"):
-                co_conv = Utils.CoordinatesConverter(CoordsSys._3DSMax, CoordsSys.Blender)
+        # The hidden templates are removed even if an import fails midway
+        try:
+            for file in self.files:
+                if file.name.casefold().endswith(".msh"):
+                    co_conv = Utils.CoordinatesConverter(CoordsSys._3DSMax, CoordsSys.Blender)
                 
-                def import_msh(file):
+                    def import_msh(file):
+                        nonlocal texture_sources
                     
-                    filepath: str = os.path.join(self.directory, file.name)
+                        filepath: str = os.path.join(self.directory, file.name)
                     
-                    target_armature: bpy.types.Object = None
+                        target_armature: bpy.types.Object = None
                     
-                    if self.apply_to_armature_in_selected == True:
-                        for obj in bpy.context.selected_objects:
-                            if obj.type == "ARMATURE":
-                                if target_armature is None:
-                                    target_armature = obj
-                                else:
-                                    msg_handler.report("ERROR", f"More than one armature has been found in the current selection. The imported mesh can only be assigned to one armature at a time.")
-                                    return
+                        if self.apply_to_armature_in_selected == True:
+                            for obj in bpy.context.selected_objects:
+                                if obj.type == "ARMATURE":
+                                    if target_armature is None:
+                                        target_armature = obj
+                                    else:
+                                        msg_handler.report("ERROR", f"More than one armature has been found in the current selection. The imported mesh can only be assigned to one armature at a time.")
+                                        return
                         
                     
-                    with open(filepath, "rb") as opened_file:
-                        try:
-                            reader = Utils.Serializer(opened_file, Utils.Serializer.Endianness.Little, Utils.Serializer.Quaternion_Order.XYZW, Utils.Serializer.Matrix_Order.ColumnMajor, co_conv)
-                            list_of_bones_used = set()
+                        # An empty file can't be mapped, it's reported like any other file that fails to parse
+                        if os.path.getsize(filepath) == 0:
+                            msg_handler.report("ERROR", f"Unexpected error while opening file at [{filepath}]: the file is empty")
+                            return
+                    
+                        # Parsed from a read-only mapping, so fixed-size blocks are decoded in place instead of being read into new buffers
+                        with open(filepath, "rb") as opened_file, mmap.mmap(opened_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                            try:
+                                # The whole file is parsed, so ask the OS to page it in at once where supported (not on Windows)
+                                if hasattr(mmap, "MADV_WILLNEED"):
+                                    mapped_file.madvise(mmap.MADV_WILLNEED)
+                                reader = Utils.Serializer(mapped_file, Utils.Serializer.Endianness.Little, Utils.Serializer.Quaternion_Order.XYZW, Utils.Serializer.Matrix_Order.ColumnMajor, co_conv)
+                                list_of_bones_used = set()
                             
-                            is_mesh08 = False
+                                is_mesh08 = False
 
-                            mesh_type = opened_file.read(6).decode("ascii", "ignore")
-                            if mesh_type == "MESH08":
-                                is_mesh08 = True
-                            else:
-                                opened_file.seek(0, 0)
+                                mesh_type = mapped_file.read(6).decode("ascii", "ignore")
+                                if mesh_type == "MESH08":
+                                    is_mesh08 = True
+                                else:
+                                    mapped_file.seek(0, 0)
 
-                            object_amount = reader.read_ushort()
+                                object_amount = reader.read_ushort()
                             
-                            file_base_name = Path(file.name).stem
-                            new_collection = None
-                            if file_base_name in bpy.data.collections:
-                                new_collection = bpy.data.collections[file_base_name]
-                            else:
-                                new_collection = bpy.data.collections.new(file_base_name)
-                                bpy.context.scene.collection.children.link(new_collection)
+                                file_base_name = Path(file.name).stem
+                                new_collection = None
+                                if file_base_name in bpy.data.collections:
+                                    new_collection = bpy.data.collections[file_base_name]
+                                else:
+                                    new_collection = bpy.data.collections.new(file_base_name)
+                                    bpy.context.scene.collection.children.link(new_collection)
                             
-                            created_objects: list[bpy.types.Object] = []
-                            object_parent_names: list[str] = []
+                                created_objects: list[bpy.types.Object] = []
+                                object_parent_names: list[str] = []
 
-                            msg_handler.debug_print(f"Importing object from: {filepath} // Is MESH08 type: {is_mesh08} // Object amount: {object_amount}")
-                            bpy.context.window_manager.progress_begin(0, object_amount)
+                                msg_handler.debug_print(f"Importing object from: {filepath} // Is MESH08 type: {is_mesh08} // Object amount: {object_amount}")
+                                bpy.context.window_manager.progress_begin(0, object_amount)
                             
-                            # If there is no target armature yet, search for any armature that has all used bones
-                            if target_armature is None:
-                                for obj in bpy.context.scene.objects:
-                                    if obj.type == "ARMATURE":
-                                        bone_names = {bone.name for bone in obj.data.bones}
-                                        
-                                        # Check if the armature has all the bones in list_of_bones_used
-                                        if list_of_bones_used.issubset(bone_names):
-                                            target_armature = obj
-                                            break
+                                # If there is no target armature yet, search for any armature that has all used bones
                                 if target_armature is None:
-                                    msg_handler.report("INFO", f"No compatible armature could be found for file at: {filepath}. Information about parenting of objects to bones will be written in custom properties.")
-                            else:
-                                bone_names = {bone.name for bone in target_armature.data.bones}
+                                    for obj in bpy.context.scene.objects:
+                                        if obj.type == "ARMATURE":
+                                            bone_names = {bone.name for bone in obj.data.bones}
                                         
-                                # Check if the armature has all the bones in list_of_bones_used
-                                if list_of_bones_used.issubset(bone_names) == False:
-                                    target_armature = None
-                                    msg_handler.report("INFO", f"Selected armature is not compatible with the imported mesh. Information about parenting of objects to bones will be written in custom properties.")
+                                            # Check if the armature has all the bones in list_of_bones_used
+                                            if list_of_bones_used.issubset(bone_names):
+                                                target_armature = obj
+                                                break
+                                    if target_armature is None:
+                                        msg_handler.report("INFO", f"No compatible armature could be found for file at: {filepath}. Information about parenting of objects to bones will be written in custom properties.")
+                                else:
+                                    bone_names = {bone.name for bone in target_armature.data.bones}
+                                        
+                                    # Check if the armature has all the bones in list_of_bones_used
+                                    if list_of_bones_used.issubset(bone_names) == False:
+                                        target_armature = None
+                                        msg_handler.report("INFO", f"Selected armature is not compatible with the imported mesh. Information about parenting of objects to bones will be written in custom properties.")
                             
-                            if target_armature is not None:
-                                bone_names_list = [bone.name for bone in target_armature.data.bones]
+                                if target_armature is not None:
+                                    target_bone_names = {bone.name for bone in target_armature.data.bones}
                             
-                            for object_num in range(object_amount):
-                                
-                                bpy.context.window_manager.progress_update(object_num)
+                                for object_num in range(object_amount):
                                 
-                                msg_handler.debug_print(f" Processing object number: {object_num}")
-                                object_name = reader.read_fixed_string(100, "euc-kr")
-                                parent_name = reader.read_fixed_string(100, "euc-kr")
+                                    bpy.context.window_manager.progress_update(object_num)
                                 
+                                    msg_handler.debug_print(f" Processing object number: {object_num}")
+                                    # The whole fixed-size header is read at once and split into its fields
+                                    object_header = MSH_OBJECT_HEADER_STRUCT.unpack_from(mapped_file, mapped_file.tell())
+                                    mapped_file.seek(MSH_OBJECT_HEADER_STRUCT.size, 1)
                                 
+                                    object_name = object_header[0].partition(b"\x00")[0].decode("euc-kr")
+                                    parent_name = object_header[1].partition(b"\x00")[0].decode("euc-kr")
                                 
-                                msg_handler.debug_print(f"  Object name: {object_name}")
-                                msg_handler.debug_print(f"  Object parent name: {parent_name}")
+                                    msg_handler.debug_print(f"  Object name: {object_name}")
+                                    msg_handler.debug_print(f"  Object parent name: {parent_name}")
                                 
-                                object_world_matrix = reader.read_converted_matrix()
+                                    world_matrix_data = object_header[2:18]
+                                    object_world_matrix = co_conv.convert_matrix(Matrix((world_matrix_data[0::4], world_matrix_data[1::4], world_matrix_data[2::4], world_matrix_data[3::4])))
                                 
-                                msg_handler.debug_print(f"  Object converted matrix: {object_world_matrix}")
+                                    if msg_handler.debug:
+                                        msg_handler.debug_print(f"  Object converted matrix: {object_world_matrix}")
                                 
-                                # Skip local and third matrices, as they are unused
-                                opened_file.seek(128,1)
+                                    vertex_amount, triangle_amount, weight_amount = object_header[18:21]
                                 
-                                vertex_amount = reader.read_ushort()
-                                triangle_amount = reader.read_ushort()
-                                weight_amount = reader.read_ushort()
+                                    # Force no parent for weighted meshes
+                                    if weight_amount != 0:
+                                        parent_name = SkeletonData.INVALID_NAME
                                 
-                                # Force no parent for weighted meshes
-                                if weight_amount != 0:
-                                    parent_name = SkeletonData.INVALID_NAME
+                                    force_parent_as_weights = False
+                                    if target_armature is not None and vertex_amount != 0 and parent_name in target_bone_names and self.preserve_parenting_relationships == False:
+                                        force_parent_as_weights = True
                                 
-                                force_parent_as_weights = False
-                                if target_armature is not None and vertex_amount != 0 and parent_name in bone_names_list and self.preserve_parenting_relationships == False:
-                                    force_parent_as_weights = True
+                                    msg_handler.debug_print(f"  Vertex amount: {vertex_amount}")
+                                    msg_handler.debug_print(f"  Triangle amount: {triangle_amount}")
+                                    msg_handler.debug_print(f"  Weight amount: {weight_amount}")
                                 
-                                msg_handler.debug_print(f"  Vertex amount: {vertex_amount}")
-                                msg_handler.debug_print(f"  Triangle amount: {triangle_amount}")
-                                msg_handler.debug_print(f"  Weight amount: {weight_amount}")
+                                    texture_path = object_header[21].partition(b"\x00")[0].decode("euc-kr")
+                                    effect_path = object_header[22].partition(b"\x00")[0].decode("euc-kr")
                                 
-                                texture_path = reader.read_fixed_string(100, "euc-kr")
-                                effect_path = reader.read_fixed_string(100, "euc-kr")
+                                    msg_handler.debug_print(f"  Texture path: {texture_path}")
+                                    msg_handler.debug_print(f"  Effect texture path: {effect_path}")
                                 
-                                msg_handler.debug_print(f"  Texture path: {texture_path}")
-                                msg_handler.debug_print(f"  Effect texture path: {effect_path}")
+                                    # I'm not actually sure about this. The values are way too high sometimes for meshes that are quite small
+                                    bounding_box_max = co_conv.convert_vector3f(Vector(object_header[23:26]))
+                                    bounding_box_min = co_conv.convert_vector3f(Vector(object_header[26:29]))
                                 
-                                # I'm not actually sure about this. The values are way too high sometimes for meshes that are quite small
-                                bounding_box_max = reader.read_converted_vector3f()
-                                bounding_box_min = reader.read_converted_vector3f()
+                                    unknown_float3_1 = object_header[29:32]
                                 
-                                unknown_float3_1 = reader.read_vector3f()
+                                    unknown_flags_1 = object_header[32:34]
                                 
-                                unknown_flags_1 = reader.read_values("2I", 8)
+                                    # Only useful for non MESH08 meshes
+                                    weight_model_type = object_header[34]
                                 
-                                # Only useful for non MESH08 meshes
-                                weight_model_type = reader.read_uint()
+                                    msg_handler.debug_print(f"  Weight model type: {weight_model_type}")
                                 
-                                msg_handler.debug_print(f"  Weight model type: {weight_model_type}")
+                                    unknown_float3_2 = object_header[35:38]
                                 
-                                unknown_float3_2 = reader.read_vector3f()
+                                    unknown_float_1 = object_header[38]
                                 
-                                unknown_float_1 = reader.read_float()
+                                    vertices = []
+                                    uvs = []
+                                    # Per triangle corner uvs in loop order, used instead of the per vertex uvs
+                                    loop_uvs = []
+                                    weights = []
+                                    weight_bones = []
+                                    triangles = []
                                 
-                                opened_file.seek(31, 1)
-                                
-                                vertices = []
-                                normals = []
-                                uvs = []
-                                weights = []
-                                weight_bones = []
-                                triangles = []
-                                
-                                if is_mesh08:
-                                    vertex_amount = reader.read_ushort()
+                                    if is_mesh08:
+                                        vertex_amount = reader.read_ushort()
                                     
-                                    msg_handler.debug_print(f"  MESH08 vertex amount: {vertex_amount}")
+                                        msg_handler.debug_print(f"  MESH08 vertex amount: {vertex_amount}")
+                                    
+                                        # The whole vertex block is decoded at once
+                                        mesh08_vertices = np.frombuffer(mapped_file, dtype=MESH08_VERTEX_DTYPE, count=vertex_amount, offset=mapped_file.tell())
+                                        mapped_file.seek(vertex_amount * MESH08_VERTEX_DTYPE.itemsize, 1)
+                                        vertices = co_conv.convert_vector3f_array(mesh08_vertices["position"])
+                                        uvs = mesh08_vertices["uv"].copy()
+                                        uvs[:, 1] *= -1.0
+                                        bone_indices = mesh08_vertices["bone_indices"].astype(np.intp)
                                     
-                                    bone_indices = []
-                                    for i in range(vertex_amount):
-                                        vertices.append(reader.read_converted_vector3f())
-                                        
-                                        read_weights = reader.read_values("3f", 12)
                                         if weight_amount > 0:
-                                            final_weights = list(read_weights)
-                                            s = sum(final_weights)
-                                            if s < (1.0 - CBB_OT_ImportMSH.WEIGHT_TOLERANCE):
-                                                final_weights.append(1.0 - s)
-                                            while len(final_weights) < 4:
-                                                final_weights.append(0.0)
-                                            if sum(final_weights) < 1e-6:
-                                                final_weights = [1.0, 0.0, 0.0, 0.0]
-                                            weights.append(final_weights)
-                                        
-                                        bone_indices.append(reader.read_values("4H", 8))
-                                        
-                                        normals.append(reader.read_converted_vector3f())
-                                        uvs.append(reader.read_values("2f", 8))
-                                        uvs[i] = (uvs[i][0], -uvs[i][1])
-                                        # Binormals, perhaps?
-                                        opened_file.seek(12, 1)
+                                            # The fourth weight is whatever the stored three leave missing from 1.0, vertices without any weight go fully to the first bone
+                                            read_weights = mesh08_vertices["weights"].astype(np.float64)
+                                            weight_sums = read_weights.sum(axis=1)
+                                            fourth_weights = np.where(weight_sums < (1.0 - CBB_OT_ImportMSH.WEIGHT_TOLERANCE), 1.0 - weight_sums, 0.0)
+                                            final_weights = np.concatenate((read_weights, fourth_weights[:, None]), axis=1)
+                                            final_weights[final_weights.sum(axis=1) < 1e-6] = (1.0, 0.0, 0.0, 0.0)
+                                            weights = final_weights.tolist()
+                                    
+                                        # The view points into the mapping, which can't be closed while it's alive
+                                        del mesh08_vertices
                                         
-                                    triangle_amount = reader.read_ushort()
+                                        triangle_amount = reader.read_ushort()
                                     
-                                    msg_handler.debug_print(f"  MESH08 triangle indices amount: {triangle_amount}")
+                                        msg_handler.debug_print(f"  MESH08 triangle indices amount: {triangle_amount}")
                                     
-                                    for i in range(int(triangle_amount/3)):
-                                        triangles.append(reader.read_values("3H", 6))
+                                        triangles = np.frombuffer(mapped_file, dtype="<u2", count=triangle_amount // 3 * 3, offset=mapped_file.tell()).astype(np.int32).reshape(-1, 3)
+                                        mapped_file.seek(triangle_amount // 3 * 6, 1)
                                     
-                                    bone_group_amount = reader.read_ushort()
-                                    unique_bone_names = []
+                                        bone_group_amount = reader.read_ushort()
+                                        # A dict keeps the order of first appearance, which vertex bone indices refer to
+                                        unique_bone_names_dict = {}
                                     
-                                    msg_handler.debug_print(f"  MESH08 bone group amount: {bone_group_amount}")
+                                        msg_handler.debug_print(f"  MESH08 bone group amount: {bone_group_amount}")
                                     
-                                    for i in range(bone_group_amount):
-                                        current_group_bone_amount = reader.read_uint()
-                                        bone_names = [reader.read_fixed_string(100, "euc-kr") for i in range(current_group_bone_amount)]
+                                        for i in range(bone_group_amount):
+                                            current_group_bone_amount = reader.read_uint()
+                                            bone_names = [CBB_OT_ImportMSH.decode_fixed_name(mapped_file.read(100)) for i in range(current_group_bone_amount)]
                                         
-                                        for bone_name in bone_names:
-                                            if bone_name not in unique_bone_names:
-                                                unique_bone_names.append(bone_name)
+                                            unique_bone_names_dict.update(dict.fromkeys(bone_names))
                                         
-                                        opened_file.seek((4-current_group_bone_amount)*100, 1)
+                                            mapped_file.seek((4-current_group_bone_amount)*100, 1)
                                     
-                                    msg_handler.debug_print(f"  Successfully read MESH08 data. Organizing bone weights")
+                                        unique_bone_names = list(unique_bone_names_dict)
                                     
-                                    for vertex_index, weight_data in enumerate(weights):
-                                        bone_names = []
-                                        for weight_count in range(len(weight_data)):
-                                            bone_names.append(unique_bone_names[bone_indices[vertex_index][weight_count]])
-                                        weight_bones.append(bone_names)
+                                        msg_handler.debug_print(f"  Successfully read MESH08 data. Organizing bone weights")
                                     
-                                else:
-                                    base_vertices = []
-                                    base_vertices_normals = []
-                                    for _ in range(vertex_amount):
-                                        base_vertices.append(reader.read_converted_vector3f())
-                                        # What might be this? It's always 1.0
-                                        opened_file.seek(4, 1)
-                                        base_vertices_normals.append(reader.read_converted_vector3f())
-                                        
-                                    msg_handler.debug_print(f"  Default mesh successfully read vertice data")
+                                        # Bone indices of every weighted vertex are mapped to names in one gather
+                                        if weights:
+                                            weight_bones = np.array(unique_bone_names, dtype=object)[bone_indices].tolist()
                                     
-                                    base_triangles = []
-                                    base_triangle_normals = []
-                                    base_triangle_uvs = []
-                                    for triangle_count in range(triangle_amount):
-                                        def __read_uv (file):
-                                            impure_uv = reader.read_values("3f", 12)
-                                            return Vector((impure_uv[0], impure_uv[1]))
+                                    else:
+                                        # The vertex and triangle blocks are decoded at once
+                                        default_vertices = np.frombuffer(mapped_file, dtype=DEFAULT_VERTEX_DTYPE, count=vertex_amount, offset=mapped_file.tell())
+                                        mapped_file.seek(vertex_amount * DEFAULT_VERTEX_DTYPE.itemsize, 1)
+                                        base_vertices = co_conv.convert_vector3f_array(default_vertices["position"])
+                                        del default_vertices
                                         
-                                        base_triangles.append(reader.read_values("3I", 12))
-                                        base_triangle_normals.append((reader.read_converted_vector3f(), reader.read_converted_vector3f(), reader.read_converted_vector3f()))
-                                        base_triangle_uvs.append((__read_uv(opened_file), 
-                                                                __read_uv(opened_file), 
-                                                                __read_uv(opened_file)))
-                                        opened_file.seek(4, 1)
+                                        msg_handler.debug_print(f"  Default mesh successfully read vertice data")
+                                    
+                                        default_triangles = np.frombuffer(mapped_file, dtype=DEFAULT_TRIANGLE_DTYPE, count=triangle_amount, offset=mapped_file.tell())
+                                        mapped_file.seek(triangle_amount * DEFAULT_TRIANGLE_DTYPE.itemsize, 1)
+                                        base_triangles = default_triangles["indices"].astype(np.int64)
+                                        base_triangle_uvs = default_triangles["uvs"][:, :, :2].astype(np.float32)
+                                        # The views point into the mapping, which can't be closed while they are alive
+                                        del default_triangles
                                     
-                                    msg_handler.debug_print(f"  Default mesh successfully read triangle data")
+                                        msg_handler.debug_print(f"  Default mesh successfully read triangle data")
                                     
-                                    base_vertices_weights = {}
-                                    if weight_model_type == 1:
-                                        bone_amount = reader.read_uint()
+                                        base_vertices_weights = {}
+                                        if weight_model_type == 1:
+                                            bone_amount = reader.read_uint()
                                         
-                                        bone_names_for_assignment = []
-                                        for _ in range(bone_amount):
-                                            bone_names_for_assignment.append(reader.read_fixed_string(100, "euc-kr"))
+                                            bone_names_for_assignment = []
+                                            for _ in range(bone_amount):
+                                                bone_names_for_assignment.append(CBB_OT_ImportMSH.decode_fixed_name(mapped_file.read(100)))
                                         
-                                        for _ in range(weight_amount):
-                                            vertex_index, amount_of_weights, bone0_index, bone1_index, bone2_index, bone3_index = struct.unpack("<IIiiii", opened_file.read(24))
-                                            bone_indices = (bone0_index, bone1_index, bone2_index, bone3_index)
-                                            
-                                            read_weights = reader.read_values("4f", 16)
-                                            bone_names = [
-                                                bone_names_for_assignment[bone_indices[i]] if bone_indices[i] != -1 else SkeletonData.INVALID_NAME
-                                                for i in range(4)
-                                            ]
-                                            base_vertices_weights[vertex_index] = (bone_names, read_weights)
-                                    else:
-                                        for _ in range(weight_amount):
-                                            vertex_index, amount_of_weights = struct.unpack("<II", opened_file.read(8))
-                                            bone_names = [reader.read_fixed_string(100, "euc-kr") for _ in range(4)]
-                                            read_weights = reader.read_values("4f", 16)
-                                            base_vertices_weights[vertex_index] = (bone_names, read_weights)
+                                            weight_records = np.frombuffer(mapped_file, dtype=DEFAULT_INDEXED_WEIGHT_DTYPE, count=weight_amount, offset=mapped_file.tell())
+                                            mapped_file.seek(weight_amount * DEFAULT_INDEXED_WEIGHT_DTYPE.itemsize, 1)
+                                        
+                                            # Bone indices are mapped to names in one gather, -1 points to the extra invalid name at the end
+                                            bone_name_lookup = np.array(bone_names_for_assignment + [SkeletonData.INVALID_NAME], dtype=object)
+                                            bone_indices = weight_records["bone_indices"]
+                                            record_bone_names = bone_name_lookup[np.where(bone_indices == -1, bone_amount, bone_indices)]
+                                            base_vertices_weights = dict(zip(weight_records["vertex_index"].tolist(), zip(record_bone_names.tolist(), weight_records["weights"].tolist())))
+                                            # The view points into the mapping, which can't be closed while it's alive
+                                            del weight_records, bone_indices
+                                        else:
+                                            for weight_record in DEFAULT_NAMED_WEIGHT_STRUCT.iter_unpack(mapped_file.read(weight_amount * DEFAULT_NAMED_WEIGHT_STRUCT.size)):
+                                                vertex_index = weight_record[0]
+                                                bone_names = [CBB_OT_ImportMSH.decode_fixed_name(raw_bone_name) for raw_bone_name in weight_record[2:6]]
+                                                read_weights = weight_record[6:10]
+                                                base_vertices_weights[vertex_index] = (bone_names, read_weights)
                                         
-                                    msg_handler.debug_print(f"  Default mesh successfully read weight data")
+                                        msg_handler.debug_print(f"  Default mesh successfully read weight data")
                                     
-                                    for i, tri in enumerate(base_triangles):
-                                        vertices_len = len(vertices)
-                                        for n, vertex_index in  enumerate(tri):
-                                            vertices.append(base_vertices[vertex_index])
-                                            normals.append(base_triangle_normals[i][n])
-                                            uvs.append(base_triangle_uvs[i][n])
-                                            
-                                            if base_vertices_weights:
-                                                vertices_weight_data = base_vertices_weights[vertex_index]
-                                                bone_names = []
-                                                bone_weights = []
-                                                for (bone_name, weight) in zip(vertices_weight_data[0], vertices_weight_data[1]):
-                                                    if bone_name != SkeletonData.INVALID_NAME:
-                                                        bone_names.append(bone_name)
-                                                        bone_weights.append(weight)
+                                        # Every triangle corner gets its own vertex, the weld below merges them back by position. Triangles that repeat
+                                        # a stored vertex are still valid polygons this way, and the weld drops them.
+                                        corner_vertex_indices = base_triangles.ravel()
+                                        vertices = base_vertices[corner_vertex_indices]
+                                        triangles = np.arange(len(corner_vertex_indices)).reshape(-1, 3)
+                                        loop_uvs = base_triangle_uvs.reshape(-1, 2)
+                                    
+                                        if base_vertices_weights:
+                                            # Filtered once per stored vertex, then shared by all of its corners
+                                            stored_vertex_weights = {}
+                                            for vertex_index in corner_vertex_indices.tolist():
+                                                if vertex_index not in stored_vertex_weights:
+                                                    vertices_weight_data = base_vertices_weights[vertex_index]
+                                                    bone_names = []
+                                                    bone_weights = []
+                                                    for (bone_name, weight) in zip(vertices_weight_data[0], vertices_weight_data[1]):
+                                                        if bone_name != SkeletonData.INVALID_NAME:
+                                                            bone_names.append(bone_name)
+                                                            bone_weights.append(weight)
+                                                    stored_vertex_weights[vertex_index] = (bone_weights, bone_names)
+                                                bone_weights, bone_names = stored_vertex_weights[vertex_index]
                                                 weights.append(bone_weights)
                                                 weight_bones.append(bone_names)
-                                                        
-                                                
-                                        triangles.append((vertices_len, vertices_len+1, vertices_len+2))
                                     
-                                    msg_handler.debug_print(f"  Default mesh successfully reconstructed vertices and triangles")
+                                        msg_handler.debug_print(f"  Default mesh successfully reconstructed vertices and triangles")
                                     
-                                    msg_handler.debug_print(f"  Default mesh type vertex amount: {len(vertices)}")
-                                    msg_handler.debug_print(f"  Default mesh type triangle amount: {len(triangles)}")
+                                        msg_handler.debug_print(f"  Default mesh type vertex amount: {len(vertices)}")
+                                        msg_handler.debug_print(f"  Default mesh type triangle amount: {len(triangles)}")
                                 
-                                msg_handler.debug_print(f"  Data from file read successfully")
+                                    msg_handler.debug_print(f"  Data from file read successfully")
                                 
-                                if vertex_amount != 0:
-                                    mesh = bpy.data.meshes.new(object_name)
-                                else: 
-                                    mesh = None
+                                    if vertex_amount != 0:
+                                        mesh = bpy.data.meshes.new(object_name)
+                                    else: 
+                                        mesh = None
                                 
-                                obj = bpy.data.objects.new(object_name, mesh)
+                                    obj = bpy.data.objects.new(object_name, mesh)
                                 
-                                obj.matrix_world = object_world_matrix
-                                obj["msh_bind_matrix"] = [v for row in object_world_matrix for v in row]
-                                new_collection.objects.link(obj)
-                                created_objects.append(obj)
+                                    obj.matrix_world = object_world_matrix
+                                    obj["msh_bind_matrix"] = [v for row in object_world_matrix for v in row]
+                                    new_collection.objects.link(obj)
+                                    created_objects.append(obj)
                                 
-                                msg_handler.debug_print(f"  Object created in Blender")
+                                    msg_handler.debug_print(f"  Object created in Blender")
                                 
-                                if vertex_amount != 0:
-                                    mesh.from_pydata(vertices, [], triangles, False)
-                                    mesh.update()
+                                    if vertex_amount != 0:
+                                        # Filled straight from flat buffers, polygon sizes follow from their loop starts
+                                        mesh.vertices.add(len(vertices))
+                                        mesh.vertices.foreach_set("co", np.asarray(vertices, dtype=np.float32).ravel())
+                                        mesh.loops.add(len(triangles) * 3)
+                                        mesh.loops.foreach_set("vertex_index", np.asarray(triangles, dtype=np.int32).ravel())
+                                        mesh.polygons.add(len(triangles))
+                                        mesh.polygons.foreach_set("loop_start", np.arange(0, len(triangles) * 3, 3, dtype=np.int32))
+                                        mesh.update(calc_edges=True)
                                 
-                                msg_handler.debug_print(f"  Mesh Data assigned")
+                                    msg_handler.debug_print(f"  Mesh Data assigned")
                                 
-                                if uvs and mesh is not None:
-                                    mesh.uv_layers.new(name="UVMap")
-                                    uv_layer = mesh.uv_layers.active.data
-                                    for poly in mesh.polygons:
-                                        for loop_index in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                                            uv = uvs[mesh.loops[loop_index].vertex_index]
-                                            uv_layer[loop_index].uv = uv
-                                    msg_handler.debug_print(f"  UV data assigned")
-                                else:
-                                    msg_handler.debug_print(f"  No UV data to assign")
+                                    if (len(uvs) or len(loop_uvs)) and mesh is not None:
+                                        uv_layer = mesh.uv_layers.new(name="UVMap")
+                                        if len(loop_uvs):
+                                            uv_layer.data.foreach_set("uv", loop_uvs.ravel())
+                                        else:
+                                            # uvs are stored per vertex, each loop takes the one of its vertex
+                                            loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+                                            mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+                                            uv_layer.data.foreach_set("uv", uvs[loop_vertex_indices].ravel())
+                                        msg_handler.debug_print(f"  UV data assigned")
+                                    else:
+                                        msg_handler.debug_print(f"  No UV data to assign")
                                 
                                 
-                                if weights and mesh is not None:
-                                    vertex_groups = {}
-                                    for group in obj.vertex_groups:
-                                        vertex_groups[group.name] = group
+                                    if weights and mesh is not None:
+                                        # Weights are summed per bone and vertex first, since a bone repeated in one vertex adds up.
+                                        # Each group then gets one add call per distinct weight instead of one per vertex.
+                                        bone_vertex_weights = {}
+                                        for vertex_index, (weight_values, bone_names) in enumerate(zip(weights, weight_bones)):
+                                            for weight_value, bone_name in zip(weight_values, bone_names):
+                                                vertex_weights = bone_vertex_weights.setdefault(bone_name, {})
+                                                vertex_weights[vertex_index] = vertex_weights.get(vertex_index, 0.0) + weight_value
                                     
-                                    for vertex_index, (weight_values, bone_names) in enumerate(zip(weights, weight_bones)):
-                                        for weight_value, bone_name in zip(weight_values, bone_names):
-                                            list_of_bones_used.add(bone_name)
-                                            
+                                        # Every group used by the mesh is created up front, in order of first use
+                                        list_of_bones_used.update(bone_vertex_weights)
+                                        vertex_groups = {group.name: group for group in obj.vertex_groups}
+                                        for bone_name in bone_vertex_weights:
                                             if bone_name not in vertex_groups:
                                                 vertex_groups[bone_name] = obj.vertex_groups.new(name=bone_name)
+                                    
+                                        for bone_name, vertex_weights in bone_vertex_weights.items():
                                             group = vertex_groups[bone_name]
-                                            
-                                            group.add([vertex_index], weight_value, "ADD")
+                                            weight_vertex_indices = {}
+                                            for vertex_index, weight_value in vertex_weights.items():
+                                                weight_vertex_indices.setdefault(weight_value, []).append(vertex_index)
+                                            for weight_value, vertex_indices in weight_vertex_indices.items():
+                                                group.add(vertex_indices, weight_value, "REPLACE")
                                     
-                                    msg_handler.debug_print(f"  Weight data assigned")
-                                else:
-                                    msg_handler.debug_print(f"  No weight data to assign")
+                                        msg_handler.debug_print(f"  Weight data assigned")
+                                    else:
+                                        msg_handler.debug_print(f"  No weight data to assign")
                                 
-                                # Set object-bone parenting as direct weight parenting.
-                                if force_parent_as_weights == True:
-                                    main_group = obj.vertex_groups.new(name=parent_name)
-                                    for vertex_index in range(len(vertices)):
-                                        main_group.add([vertex_index], 1.0, "ADD")
-                                    parent_name = SkeletonData.INVALID_NAME
+                                    # Set object-bone parenting as direct weight parenting.
+                                    if force_parent_as_weights == True:
+                                        main_group = obj.vertex_groups.new(name=parent_name)
+                                        main_group.add(list(range(len(vertices))), 1.0, "REPLACE")
+                                        parent_name = SkeletonData.INVALID_NAME
                                 
-                                object_parent_names.append(parent_name)
+                                    object_parent_names.append(parent_name)
                                 
-                                if texture_path:
-                                    texture_path = ntpath.basename(texture_path)
-                                    texture_image, alpha_analysis = self.get_texture_as_image(
-                                        self.directory, 
-                                        texture_path, 
-                                        CBB_OT_ImportMSH.EXTRACTION_FOLDER, 
-                                        5
-                                    )
+                                    if texture_path:
+                                        texture_path = ntpath.basename(texture_path)
+                                        material_name = f"Mat_{texture_path}"
+                                        # Existing materials and texture paths already looked up in this import don't need any file search
+                                        if material_name in bpy.data.materials:
+                                            texture_image, alpha_analysis = None, None
+                                        elif texture_path in texture_lookups:
+                                            texture_image, alpha_analysis = texture_lookups[texture_path]
+                                        else:
+                                            if texture_sources is None:
+                                                texture_sources = self.find_texture_sources(self.directory, 5)
+                                            texture_image, alpha_analysis = self.get_texture_as_image(texture_path, texture_sources, texture_cache)
+                                            texture_lookups[texture_path] = (texture_image, alpha_analysis)
                                     
-                                    # apply_texture_to_mesh handles all cases: new material, existing material, or None
-                                    CBB_OT_ImportMSH.apply_texture_to_mesh(obj, texture_image, texture_path, alpha_analysis)
+                                        # apply_texture_to_mesh handles all cases: new material, existing material, or None
+                                        CBB_OT_ImportMSH.apply_texture_to_mesh(obj, texture_image, texture_path, alpha_analysis, material_templates)
                                     
-                                    if texture_image is not None or f"Mat_{texture_path}" in bpy.data.materials:
-                                        msg_handler.debug_print(f"  Texture data assigned")
+                                        if texture_image is not None or material_name in bpy.data.materials:
+                                            msg_handler.debug_print(f"  Texture data assigned")
+                                        else:
+                                            msg_handler.report("INFO", f"Could not find texture: {texture_path}")
+                                            msg_handler.debug_print(f"  Texture data assignment failed")
                                     else:
-                                        msg_handler.report("INFO", f"Could not find texture: {texture_path}")
-                                        msg_handler.debug_print(f"  Texture data assignment failed")
-                                else:
-                                    msg_handler.debug_print(f"  Object has no texture path")
+                                        msg_handler.debug_print(f"  Object has no texture path")
                                     
-                                if vertex_amount != 0:
-                                    bm = bmesh.new()
-                                    bm.from_mesh(mesh)
+                                    # Both formats split vertices along uv seams and hard edges, welding by position joins them back and drops
+                                    # the degenerate triangles left behind
+                                    if vertex_amount != 0:
+                                        bm = bmesh.new()
+                                        bm.from_mesh(mesh)
 
-                                    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+                                        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
 
-                                    bm.to_mesh(mesh)
-                                    mesh.update()
+                                        bm.to_mesh(mesh)
+                                        mesh.update()
 
-                                    bm.free()
+                                        bm.free()
                             
                             
-                            for created_object, parent_name in zip(created_objects, object_parent_names):
-                                if target_armature is not None and created_object.type == "MESH":
-                                    armature_modifier = created_object.modifiers.new(name="Armature", type="ARMATURE")
-                                    armature_modifier.object = target_armature
+                                scene_objects = bpy.context.scene.objects
+                                for created_object, parent_name in zip(created_objects, object_parent_names):
+                                    if target_armature is not None and created_object.type == "MESH":
+                                        armature_modifier = created_object.modifiers.new(name="Armature", type="ARMATURE")
+                                        armature_modifier.object = target_armature
                                     
-                                if parent_name != SkeletonData.INVALID_NAME:
-                                    if parent_name in bpy.context.scene.objects:
-                                        created_object.parent = bpy.context.scene.objects[parent_name]
-                                        created_object.matrix_parent_inverse = bpy.context.scene.objects[parent_name].matrix_world.inverted()
+                                    if parent_name != SkeletonData.INVALID_NAME:
+                                        parent_object = scene_objects.get(parent_name)
+                                        if parent_object is not None:
+                                            created_object.parent = parent_object
+                                            created_object.matrix_parent_inverse = parent_object.matrix_world.inverted()
                                         
-                                    elif target_armature is not None and parent_name in target_armature.data.bones:
-                                        created_object.parent = target_armature
-                                        created_object.parent_type = "BONE"
-                                        created_object.parent_bone = parent_name
-                                        bone: bpy.types.PoseBone = target_armature.pose.bones[parent_name]
+                                        elif target_armature is not None and parent_name in target_bone_names:
+                                            created_object.parent = target_armature
+                                            created_object.parent_type = "BONE"
+                                            created_object.parent_bone = parent_name
+                                            bone: bpy.types.PoseBone = target_armature.pose.bones[parent_name]
                                         
-                                        vec = bone.head - bone.tail
-                                        trans = Matrix.Translation(vec)
-                                        created_object.matrix_parent_inverse = (target_armature.matrix_world @ bone.matrix).inverted_safe() @ trans
-                                    else:
-                                        created_object["intended_parent_name"] = parent_name
-                            
-                            bpy.context.view_layer.update()
+                                            vec = bone.head - bone.tail
+                                            trans = Matrix.Translation(vec)
+                                            created_object.matrix_parent_inverse = (target_armature.matrix_world @ bone.matrix).inverted_safe() @ trans
+                                        else:
+                                            created_object["intended_parent_name"] = parent_name
                                 
 
-                        except UnicodeDecodeError as e:
-                            msg_handler.report("ERROR", f"Unicode decode error while opening file at [{filepath}]: {e}")
-                            traceback.print_exc()
-                            return
+                            except UnicodeDecodeError as e:
+                                msg_handler.report("ERROR", f"Unicode decode error while opening file at [{filepath}]: {e}")
+                                traceback.print_exc()
+                                return
                         
-                        except Exception as e:
-                            msg_handler.report("ERROR", f"Unexpected error while opening file at [{filepath}]: {e}")
-                            traceback.print_exc()
-                            return
+                            except Exception as e:
+                                msg_handler.report("ERROR", f"Unexpected error while opening file at [{filepath}]: {e}")
+                                traceback.print_exc()
+                                return
+
+                    import_msh(file)
 
-                import_msh(file)
+        finally:
+            for material_template in material_templates.values():
+                bpy.data.materials.remove(material_template)
+        
+        # A single depsgraph refresh for every imported file
+        bpy.context.view_layer.update()
 
         return {"FINISHED"}
 
@@ -885,6 +1097,18 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
         default="STANDARD"
     ) # type: ignore
 
+    @staticmethod
+    def unique_in_order(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Like np.unique, but unique entries are numbered in order of first appearance instead of sorted order.
+        Returns the index of the first appearance of every unique entry and the unique number of every entry.
+        """
+        _, first_indices, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        appearance_order = np.argsort(first_indices)
+        unique_numbers = np.empty_like(appearance_order)
+        unique_numbers[appearance_order] = np.arange(len(appearance_order))
+        return first_indices[appearance_order], unique_numbers[inverse.ravel()]
+
     def execute(self, context):
         return self.export_meshes(context, self.directory)
 
@@ -955,7 +1179,7 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                 try:
                     msg_handler.debug_print(f"Exporting objects to file at [{export_file_path}]")
                     
-                    def __add_object_data(object_index: int , name: str, parent_name: str, world_matrix: Matrix, local_matrix: Matrix, exporting_vertices, exporting_normals, exporting_uvs, exporting_polygons, exporting_weights, exporting_unique_bones_list, texture_path, effect_path):
+                    def __add_object_data(object_index: int , name: str, parent_name: str, world_matrix: Matrix, local_matrix: Matrix, exporting_vertices, exporting_normals, exporting_uvs, exporting_polygons, exporting_weights, exporting_bone_indices, exporting_unique_bones_list, texture_path, effect_path):
                         nonlocal object_amount
                         nonlocal object_names
                         nonlocal object_parent_names
@@ -978,75 +1202,56 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                         object_world_matrices.append(world_matrix)
                         object_local_matrices.append(local_matrix)
                         object_inverse_parent_matrices.append(Matrix.Identity(4))
-                        vertex_data = []
-                        face_data = []
-                        weight_data = []
+                        # Vertex, face and weight records are built as numpy arrays in file layout, already converted, so the writer only dumps their bytes
+                        exporting_vertices = np.asarray(exporting_vertices, dtype=np.float32).reshape(-1, 3)
+                        exporting_normals = np.asarray(exporting_normals, dtype=np.float32).reshape(-1, 3)
+                        exporting_uvs = np.asarray(exporting_uvs, dtype=np.float32).reshape(-1, 2)
+                        exporting_polygons = np.asarray(exporting_polygons, dtype=np.int64).reshape(-1, 3)
+                        exporting_weights = np.asarray(exporting_weights, dtype=np.float32).reshape(-1, 3)
+                        exporting_bone_indices = np.asarray(exporting_bone_indices, dtype=np.int64).reshape(-1, 4)
                         
                         if mesh_export_format == "MESH08":
-                            for vertex_index in range(len(exporting_vertices)):
-                                vertex_position = exporting_vertices[vertex_index]
-                                weight_values = (0.0, 0.0, 0.0)
-                                unique_bone_indices = (0, 0, 0, 0)
-                                vertex_normal = exporting_normals[vertex_index]
-                                vertex_uv = exporting_uvs[vertex_index]
-                                vertex_binormal = (0.0, 0.0, 0.0)
-
-                                # Populate weight values and bone indices (limit to 4)
-                                if exporting_weights:
-                                    weight_values = exporting_weights[vertex_index][0]
-                                    unique_bone_indices = exporting_weights[vertex_index][1]
-
-                                # Append all data as a tuple to the vertex data collection
-                                vertex_data.append((vertex_position, weight_values, unique_bone_indices, vertex_normal, vertex_uv, vertex_binormal))
+                            vertex_data = np.zeros(len(exporting_vertices), dtype=MESH08_VERTEX_DTYPE)
+                            vertex_data["position"] = co_conv.convert_vector3f_array(exporting_vertices)
+                            # Populate weight values and bone indices (limit to 4)
+                            if len(exporting_weights):
+                                vertex_data["weights"] = exporting_weights
+                                vertex_data["bone_indices"] = exporting_bone_indices.astype(np.int16).view(np.uint16)
+                            if parent_name != SkeletonData.INVALID_NAME:
+                                # For some reason, if a certain object holds no weight data, having the fourth index as not 0 causes the mesh to go invisible.
+                                vertex_data["bone_indices"] = np.array((-1, -1, -1, 0), dtype=np.int16).view(np.uint16)
+                            vertex_data["normal"] = co_conv.convert_vector3f_array(exporting_normals)
+                            vertex_data["uv"] = exporting_uvs * np.array((1.0, -1.0), dtype=np.float32)
+                            vertex_data["binormal"] = co_conv.convert_vector3f_array(np.zeros((len(exporting_vertices), 3), dtype=np.float32))
 
                             # Build face data collection
-                            
-                            for tri in exporting_polygons:
-                                face_data.extend(tri)
+                            face_data = exporting_polygons.astype("<u2").ravel()
 
+                            weight_data = []
                             for i in range(0, len(exporting_unique_bones_list), 4):
                                 bone_group = exporting_unique_bones_list[i:i+4]
                                 weight_data.append((len(bone_group), bone_group))
                         else:
-                            for vertex_index in range(len(exporting_vertices)):
-                                vertex_position = exporting_vertices[vertex_index]
-                                vertex_normal = exporting_normals[vertex_index]
-
-                                # Append all data as a tuple to the vertex data collection
-                                vertex_data.append((vertex_position, 1.0, vertex_normal))
-                                valid_bone_amount = 0
-                                
-                                
-                                exporter_weight = exporting_weights[vertex_index]
-                                
-                                for bone_index in exporter_weight[1]:
-                                    if bone_index != -1:
-                                        valid_bone_amount += 1
-                                current_exporting_weights = exporter_weight[0]
-                                
-                                weight_sum = current_exporting_weights[0] + current_exporting_weights[1] + current_exporting_weights[2]
-                                
-                                if weight_sum < 1.0-CBB_OT_ImportMSH.WEIGHT_TOLERANCE:
-                                    current_exporting_weights = (current_exporting_weights[0], current_exporting_weights[1], current_exporting_weights[2], 1.0-weight_sum)
-                                else:
-                                    current_exporting_weights = (current_exporting_weights[0], current_exporting_weights[1], current_exporting_weights[2], 0.0)
-                                weight_data.append((vertex_index, valid_bone_amount, exporter_weight[1], current_exporting_weights))
-                                    
-                                
-                            for tri in exporting_polygons:
-                                def __get_extended_uv(uv):
-                                    return (uv[0], uv[1], 0.0)
-                                
-                                # Ensure you are accessing the UVs and normals using the indices in tri
-                                face_normals_to_export = (exporting_normals[tri[0]], exporting_normals[tri[1]], exporting_normals[tri[2]])
-                                face_uvs_to_export = (
-                                    __get_extended_uv(exporting_uvs[tri[0]]), 
-                                    __get_extended_uv(exporting_uvs[tri[1]]), 
-                                    __get_extended_uv(exporting_uvs[tri[2]])
-                                )
-                                
-                                # Append the flattened data to face_data
-                                face_data.append((tri, face_normals_to_export, face_uvs_to_export, 0))
+                            vertex_data = np.zeros(len(exporting_vertices), dtype=DEFAULT_VERTEX_DTYPE)
+                            vertex_data["position"] = co_conv.convert_vector3f_array(exporting_vertices)
+                            vertex_data["unknown"] = 1.0
+                            vertex_data["normal"] = exporting_normals
+                            
+                            # The fourth weight is whatever the three stored ones leave to reach 1.0
+                            weight_data = np.zeros(len(exporting_vertices), dtype=DEFAULT_INDEXED_WEIGHT_DTYPE)
+                            if len(exporting_weights):
+                                weight_sums = exporting_weights[:, 0].astype(np.float64) + exporting_weights[:, 1] + exporting_weights[:, 2]
+                                weight_data["vertex_index"] = np.arange(len(exporting_vertices))
+                                weight_data["weight_amount"] = np.count_nonzero(exporting_bone_indices != -1, axis=1)
+                                weight_data["bone_indices"] = exporting_bone_indices
+                                weight_data["weights"][:, :3] = exporting_weights
+                                weight_data["weights"][:, 3] = np.where(weight_sums < 1.0-CBB_OT_ImportMSH.WEIGHT_TOLERANCE, 1.0 - weight_sums, 0.0)
+                            
+                            # Ensure you are accessing the UVs and normals using the indices in tri
+                            face_data = np.zeros(len(exporting_polygons), dtype=DEFAULT_TRIANGLE_DTYPE)
+                            face_data["indices"] = exporting_polygons
+                            face_data["normals"] = co_conv.convert_vector3f_array(exporting_normals[exporting_polygons.ravel()]).reshape(-1, 3, 3)
+                            face_data["uvs"][:, :, :2] = exporting_uvs[exporting_polygons]
                                 
                         object_vertex_amounts.append(len(exporting_vertices))
                         object_face_amounts.append(len(exporting_polygons))
@@ -1060,19 +1265,50 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                         object_weight_data[object_index] = weight_data
                     
                     
+                    # Fallback for objects without a stored bind matrix: jump to frame 0 with armatures in rest pose
+                    # once for the whole export, sample their world matrices there, then restore state.
+                    rest_world_matrices: dict[str, Matrix] = {}
+                    rest_objects = [object for object in objects if "msh_bind_matrix" not in object]
+                    if rest_objects:
+                        old_frame = bpy.context.scene.frame_current
+                        # Several armature objects can share one armature, its pose position is saved the first time only
+                        old_pose_positions = {}
+                        try:
+                            for arm in [object for object in bpy.data.objects if object.type == "ARMATURE"]:
+                                if arm.data not in old_pose_positions:
+                                    old_pose_positions[arm.data] = arm.data.pose_position
+                                    arm.data.pose_position = 'REST'
+                            bpy.context.scene.frame_set(0)
+                            bpy.context.view_layer.update()
+                            
+                            for object in rest_objects:
+                                rest_world_matrices[object.name] = object.matrix_world.copy()
+                        finally:
+                            bpy.context.scene.frame_set(old_frame)
+                            for armature, pose_pos in old_pose_positions.items():
+                                armature.pose_position = pose_pos
+                            bpy.context.view_layer.update()
+                    
+                    # Albedo texture path per material, keyed by its pointer so shared materials scan their node tree once
+                    material_texture_paths: dict[int, str] = {}
+                    def __get_material_texture_path(material: bpy.types.Material) -> str:
+                        material_key = material.as_pointer()
+                        if material_key not in material_texture_paths:
+                            texture_path = ""
+                            if material.use_nodes:
+                                for node in material.node_tree.nodes:
+                                    if node.type == 'BSDF_PRINCIPLED':
+                                        albedo_texture = Utils.find_image_texture_for_input(node, 'Base Color')
+                                        if albedo_texture:
+                                            texture_path = f"D:\\{albedo_texture.name}"
+                                        break
+                            material_texture_paths[material_key] = texture_path
+                        return material_texture_paths[material_key]
+                    
                     for object in objects:
                         object_name = object.name
                         object_parent_name = ""
                         
-                        exporter_vertices:list[Vector] = []
-                        exporter_normals = []
-                        exporter_uvs = []
-                        exporter_polygons = []
-                        exporter_weights = []
-                        object_texture_path = ""
-                        unique_bones_list: list[str] = []
-                        polygon_indices_amount = 0
-                        
                         parent_matrix: Matrix = None
                         if object.parent:
                             if object.parent_type == "BONE":
@@ -1093,69 +1329,96 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                             raw = object["msh_bind_matrix"]
                             object_world_matrix = Matrix([raw[i*4:(i+1)*4] for i in range(4)])
                         else:
-                            # Fallback: jump to frame 0 with armatures in rest pose,
-                            # sample the world matrix there, then restore state.
-                            old_frame = bpy.context.scene.frame_current
-                            old_pose_positions = {}
-                            for arm in bpy.data.objects:
-                                if arm.type == "ARMATURE":
-                                    old_pose_positions[arm] = arm.data.pose_position
-                                    arm.data.pose_position = 'REST'
-                            bpy.context.scene.frame_set(0)
-                            bpy.context.view_layer.update()
-                            
-                            object_world_matrix = object.matrix_world.copy()
-                            
-                            bpy.context.scene.frame_set(old_frame)
-                            for arm, pose_pos in old_pose_positions.items():
-                                arm.data.pose_position = pose_pos
-                            bpy.context.view_layer.update()
+                            object_world_matrix = rest_world_matrices[object.name]
                         
                         object_local_matrix = (parent_matrix.inverted() @ object_world_matrix) if parent_matrix else object_world_matrix
                         
-                        material = None
-                        
-                        if object.material_slots:
-                            material = object.material_slots[0].material
-                            
-                        albedo_texture: bpy.types.Image = None
-                        if material and material.use_nodes:
-                            node_tree = material.node_tree
-                            for node in node_tree.nodes:
-                                if node.type == 'BSDF_PRINCIPLED':
-                                    albedo_texture = Utils.find_image_texture_for_input(node, 'Base Color')
-                        
-                        if albedo_texture:
-                            object_texture_path = f"D:\\{albedo_texture.name}"
-                        
                         if object.type == "MESH":
                             mesh: bpy.types.Mesh = object.data
                             mesh_vertices = mesh.vertices
                             mesh_polygons = mesh.polygons
                             mesh_loops = mesh.loops
-                            mesh_uvs = mesh.uv_layers.active.data if mesh.uv_layers.active else None
+                            mesh_uv_layer = mesh.uv_layers.active
+                            mesh_uvs = mesh_uv_layer.data if mesh_uv_layer else None
 
-                            msg_handler.debug_print(f"Object [{object.name}]'s vertex amount: [{len(mesh_vertices)}]")
-                            msg_handler.debug_print(f"Object [{object.name}]'s polygon amount: [{len(mesh_polygons)}]")
-                            msg_handler.debug_print(f"Object [{object.name}]'s loop amount: [{len(mesh_loops)}]")
-                            if mesh_uvs is not None:
-                                msg_handler.debug_print(f"Object [{object.name}]'s uv amount: [{len(mesh_uvs)}]")
+                            # Checked up front so the messages and their RNA len() calls are skipped entirely without debug output
+                            if msg_handler.debug:
+                                msg_handler.debug_print(f"Object [{object.name}]'s vertex amount: [{len(mesh_vertices)}]")
+                                msg_handler.debug_print(f"Object [{object.name}]'s polygon amount: [{len(mesh_polygons)}]")
+                                msg_handler.debug_print(f"Object [{object.name}]'s loop amount: [{len(mesh_loops)}]")
+                                if mesh_uvs is not None:
+                                    msg_handler.debug_print(f"Object [{object.name}]'s uv amount: [{len(mesh_uvs)}]")
 
                             # Step 1: Get original vertices
-                            original_mesh_vertices = [v.co for v in mesh_vertices]
+                            original_mesh_vertices = np.empty(len(mesh_vertices) * 3, dtype=np.float32)
+                            mesh_vertices.foreach_get("co", original_mesh_vertices)
+                            original_mesh_vertices = original_mesh_vertices.reshape(-1, 3)
+                            
+                            # Per loop data is fetched in bulk, a loop's export vertex is identified by its vertex index, normal and uv
+                            loop_amount = len(mesh_loops)
+                            loop_vertex_indices = np.empty(loop_amount, dtype=np.int32)
+                            mesh_loops.foreach_get("vertex_index", loop_vertex_indices)
+                            # Corner normals are read from the mesh's cached array rather than through every MeshLoop
+                            loop_normals = np.empty(loop_amount * 3, dtype=np.float32)
+                            mesh.corner_normals.foreach_get("vector", loop_normals)
+                            loop_uvs = np.zeros(loop_amount * 2, dtype=np.float32)
+                            if mesh_uvs is not None:
+                                # The layer's uv attribute array, not the MeshUVLoop wrappers
+                                mesh_uv_layer.uv.foreach_get("vector", loop_uvs)
+                            loop_normals = loop_normals.reshape(-1, 3)
+                            loop_uvs = loop_uvs.reshape(-1, 2)
+                            # Keys are compared as raw bytes, which sorts much faster than field by field. Adding 0.0 turns -0.0 into 0.0
+                            # so equal floats always have equal bytes.
+                            loop_keys = np.empty(loop_amount, dtype=[("vertex_index", "<i4"), ("normal", "<f4", 3), ("uv", "<f4", 2)])
+                            loop_keys["vertex_index"] = loop_vertex_indices
+                            loop_keys["normal"] = loop_normals + 0.0
+                            loop_keys["uv"] = loop_uvs + 0.0
+                            loop_keys = loop_keys.view(np.dtype((np.void, loop_keys.dtype.itemsize)))
+                            
+                            polygon_loop_starts = np.empty(len(mesh_polygons), dtype=np.int32)
+                            mesh_polygons.foreach_get("loop_start", polygon_loop_starts)
+                            polygon_loop_totals = np.empty(len(mesh_polygons), dtype=np.int32)
+                            mesh_polygons.foreach_get("loop_total", polygon_loop_totals)
+                            
+                            # Vertex group weights of all vertices, read in a single pass. Vertex i owns the entries from
+                            # weight_offsets[i] to weight_offsets[i + 1].
+                            vertex_weight_amounts = np.empty(len(mesh_vertices), dtype=np.int64)
+                            weight_group_indices = []
+                            weight_values = []
+                            for vertex_index, mesh_vertex in enumerate(mesh_vertices):
+                                groups = mesh_vertex.groups
+                                vertex_weight_amounts[vertex_index] = len(groups)
+                                for group in groups:
+                                    weight_group_indices.append(group.group)
+                                    weight_values.append(group.weight)
+                            weight_group_indices = np.array(weight_group_indices, dtype=np.int64)
+                            weight_values = np.array(weight_values, dtype=np.float32)
+                            weight_offsets = np.concatenate(((0,), np.cumsum(vertex_weight_amounts)))
+                            
+                            # Bone name of every vertex group, entries of unnamed or missing groups are skipped
+                            vertex_group_names = [vertex_group.name for vertex_group in object.vertex_groups]
+                            vertex_group_is_named = np.array([bool(name) for name in vertex_group_names], dtype=bool)
 
                             # --- NEW LOGIC: Group Polygons by Material Index ---
+                            # Groups keep the order in which their material first appears, each holds its polygon indices in mesh order
                             material_polygon_groups = {}
-                            if not mesh_polygons:
-                                # Handle empty mesh case if needed, or just skip
-                                pass
-                            else:
-                                for poly in mesh_polygons:
-                                    # If face has no material, default to 0
-                                    mat_idx = poly.material_index if poly.material_index < len(object.material_slots) else 0
-                                    if mat_idx not in material_polygon_groups:
-                                        material_polygon_groups[mat_idx] = []
-                                    material_polygon_groups[mat_idx].append(poly)
+                            if mesh_polygons:
+                                polygon_material_indices = np.empty(len(mesh_polygons), dtype=np.int32)
+                                mesh_polygons.foreach_get("material_index", polygon_material_indices)
+                                # If face has no material, default to 0
+                                polygon_material_indices[polygon_material_indices >= len(object.material_slots)] = 0
+                                
+                                if (polygon_material_indices == polygon_material_indices[0]).all():
+                                    # Single material, the usual case, needs no partitioning
+                                    material_polygon_groups[int(polygon_material_indices[0])] = np.arange(len(mesh_polygons))
+                                else:
+                                    first_group_polygons, polygon_groups = CBB_OT_ExportMSH.unique_in_order(polygon_material_indices)
+                                    grouped_polygons = np.argsort(polygon_groups, kind="stable")
+                                    group_sizes = np.bincount(polygon_groups)
+                                    group_ends = np.cumsum(group_sizes)
+                                    group_starts = group_ends - group_sizes
+                                    for mat_idx, group_start, group_end in zip(polygon_material_indices[first_group_polygons].tolist(), group_starts.tolist(), group_ends.tolist()):
+                                        material_polygon_groups[mat_idx] = grouped_polygons[group_start:group_end]
 
                             # Iterate through each material group and export as a sub-object
                             for mat_idx, group_polys in material_polygon_groups.items():
@@ -1165,17 +1428,7 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                 if mat_idx < len(object.material_slots):
                                     current_material = object.material_slots[mat_idx].material
                                 
-                                current_texture_path = ""
-                                if current_material and current_material.use_nodes:
-                                    mat_albedo_texture = None
-                                    node_tree = current_material.node_tree
-                                    for node in node_tree.nodes:
-                                        if node.type == 'BSDF_PRINCIPLED':
-                                            mat_albedo_texture = Utils.find_image_texture_for_input(node, 'Base Color')
-                                            break
-                                    
-                                    if mat_albedo_texture:
-                                        current_texture_path = f"D:\\{mat_albedo_texture.name}"
+                                current_texture_path = __get_material_texture_path(current_material) if current_material else ""
                                 
                                 # For now, we follow the plan: look for texture for EACH material slot.
                                 if not current_texture_path:
@@ -1183,98 +1436,59 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                     # but user requested specific lookup.
                                     current_texture_path = ""
 
-                                msg_handler.debug_print(f"Processing Material Group {mat_idx} for Object [{object.name}]. Texture: {current_texture_path}")
+                                if msg_handler.debug:
+                                    msg_handler.debug_print(f"Processing Material Group {mat_idx} for Object [{object.name}]. Texture: {current_texture_path}")
 
                                 # 2. Process Geometry for THIS group
                                 
                                 # --- OPTIMIZATION START ---
                                 
-                                # Pre-cache bone names to avoid API calls inside the loop
-                                # Maps group index -> bone name
-                                group_index_to_bone_name = {g.index: g.name for g in object.vertex_groups}
 
+                                # Loops of the group's polygons, in polygon order
+                                group_polygon_loop_totals = polygon_loop_totals[group_polys]
+                                group_polygon_offsets = np.cumsum(group_polygon_loop_totals) - group_polygon_loop_totals
+                                group_loop_indices = np.repeat(polygon_loop_starts[group_polys] - group_polygon_offsets, group_polygon_loop_totals) + np.arange(group_polygon_loop_totals.sum())
+                                
+                                # Loops with the same (vertex_index, normal, uv) share one export vertex, numbered in order of first appearance
+                                first_loop_indices, group_loop_export_indices = CBB_OT_ExportMSH.unique_in_order(loop_keys[group_loop_indices])
+                                unique_loop_indices = group_loop_indices[first_loop_indices]
+                                unique_vertex_indices = loop_vertex_indices[unique_loop_indices]
+                                
                                 # Prepare storage for this group
-                                group_exporter_vertices = []
-                                group_exporter_normals = []
-                                group_exporter_uvs = []
-                                group_exporter_weights = []
-                                group_exporter_polygons = []
+                                group_exporter_vertices = original_mesh_vertices[unique_vertex_indices]
+                                group_exporter_normals = loop_normals[unique_loop_indices]
+                                group_exporter_uvs = loop_uvs[unique_loop_indices]
                                 
-                                # Map (vertex_index, uv, normal) -> new_index for split detection
-                                mesh_vertex_to_export_vertex_map = {}
+                                # Weight entries of the unique vertices, in vertex order
+                                unique_vertex_count = len(unique_vertex_indices)
+                                entry_amounts = vertex_weight_amounts[unique_vertex_indices]
+                                entry_offsets = np.cumsum(entry_amounts) - entry_amounts
+                                entry_indices = np.repeat(weight_offsets[unique_vertex_indices] - entry_offsets, entry_amounts) + np.arange(entry_amounts.sum())
+                                entry_vertices = np.repeat(np.arange(unique_vertex_count), entry_amounts)
+                                entry_groups = weight_group_indices[entry_indices]
+                                valid_entries = entry_groups < len(vertex_group_names)
+                                valid_entries[valid_entries] = vertex_group_is_named[entry_groups[valid_entries]]
+                                entry_indices = entry_indices[valid_entries]
+                                entry_vertices = entry_vertices[valid_entries]
+                                entry_groups = entry_groups[valid_entries]
+                                entry_weights = weight_values[entry_indices]
                                 
-                                # Unique bones used in this specific material group
-                                group_unique_bones_used = set()
-                                group_unique_bones_used_indices = {}
-                                group_unique_bones_list = [] 
-
-                                for poly in group_polys:
-                                    poly_indices = []
-                                    for loop_index in poly.loop_indices:
-                                        loop = mesh_loops[loop_index]
-                                        uv = tuple(mesh_uvs[loop.index].uv) if mesh_uvs else (0.0, 0.0)
-                                        normal = tuple(loop.normal)
-                                        
-                                        # Key for uniqueness
-                                        vertex_key = (loop.vertex_index, uv, normal)
-                                        
-                                        if vertex_key not in mesh_vertex_to_export_vertex_map:
-                                            # New unique vertex found
-                                            new_index = len(group_exporter_vertices)
-                                            mesh_vertex_to_export_vertex_map[vertex_key] = new_index
-                                            
-                                            # Add geometry data
-                                            group_exporter_vertices.append(original_mesh_vertices[loop.vertex_index])
-                                            group_exporter_normals.append(normal)
-                                            group_exporter_uvs.append(uv)
-                                            
-                                            # Process Bone Weights Immediatelly
-                                            mesh_vertex = mesh_vertices[loop.vertex_index]
-                                            groups = mesh_vertex.groups
-                                            
-                                            bone_weight_pairs = []
-                                            for group in groups:
-                                                # Use cached bone name login
-                                                bone_name = group_index_to_bone_name.get(group.group)
-                                                if not bone_name: continue
-                                                
-                                                if bone_name not in group_unique_bones_used:
-                                                    group_unique_bones_used_indices[bone_name] = len(group_unique_bones_list)
-                                                    group_unique_bones_used.add(bone_name)
-                                                    group_unique_bones_list.append(bone_name)
-                                                
-                                                bone_index = group_unique_bones_used_indices[bone_name]
-                                                bone_weight_pairs.append((bone_index, group.weight))
-                                            
-                                            # Sort & Limit Weights (same logic as before)
-                                            bone_weight_pairs.sort(key=lambda x: x[1], reverse=True)
-                                            bone_weight_pairs = bone_weight_pairs[:4]
-                                            
-                                            bone_indices, weights = zip(*bone_weight_pairs) if bone_weight_pairs else ([], [])
-                                            
-                                            if len(weights) > 3:
-                                                weights = weights[:3]
-                                            else:
-                                                weights = list(weights) + [0.0] * (3 - len(bone_indices))
-                                            
-                                            bone_indices = list(bone_indices) + [-1] * (4 - len(bone_indices))
-                                            
-                                            group_exporter_weights.append((weights, bone_indices))
-                                        
-                                        # Use the mapped index
-                                        poly_indices.append(mesh_vertex_to_export_vertex_map[vertex_key])
-
-                                    # Triangulate directly
-                                    amount_of_polys = len(poly_indices)
-                                    if amount_of_polys == 3:
-                                        group_exporter_polygons.append(poly_indices)
-                                    elif amount_of_polys == 4:
-                                        group_exporter_polygons.append([poly_indices[0], poly_indices[1], poly_indices[2]])
-                                        group_exporter_polygons.append([poly_indices[0], poly_indices[2], poly_indices[3]])
-                                    else:
-                                        v0 = poly_indices[0]
-                                        for k in range(1, amount_of_polys - 1):
-                                            group_exporter_polygons.append([v0, poly_indices[k], poly_indices[k + 1]])
+                                # Unique bones used in this specific material group, numbered in order of first use
+                                first_bone_entries, entry_bones = CBB_OT_ExportMSH.unique_in_order(entry_groups)
+                                group_unique_bones_list = [vertex_group_names[group_index] for group_index in entry_groups[first_bone_entries].tolist()]
+                                
+                                # Keep the four strongest weights of every vertex, equal weights keep their group order
+                                vertex_bone_indices, vertex_weights = Utils.get_strongest_weights_array(entry_vertices, entry_bones, entry_weights, unique_vertex_count)
+                                
+                                # Only three weights are stored, the fourth is implied
+                                group_exporter_weights = vertex_weights[:, :3]
+                                group_exporter_bone_indices = vertex_bone_indices
+                                
+                                # Fan triangulation of every polygon at once, polygon i gives (0, k, k + 1) for k in 1..n-2 of its loops
+                                group_polygon_triangle_amounts = np.maximum(group_polygon_loop_totals - 2, 0)
+                                triangle_polygon_offsets = np.repeat(group_polygon_offsets, group_polygon_triangle_amounts)
+                                triangle_fan_indices = np.arange(group_polygon_triangle_amounts.sum()) - np.repeat(np.cumsum(group_polygon_triangle_amounts) - group_polygon_triangle_amounts, group_polygon_triangle_amounts) + 1
+                                group_exporter_polygons = group_loop_export_indices[np.stack((triangle_polygon_offsets, triangle_polygon_offsets + triangle_fan_indices, triangle_polygon_offsets + triangle_fan_indices + 1), axis=1)]
 
                                 # --- OPTIMIZATION END ---
 
@@ -1287,7 +1501,8 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                 # Safe bet: {object_name}_{mat_idx}
                                 sub_object_base_name = object_name if mat_idx == 0 else f"{object_name}_{mat_idx}"
                                 
-                                msg_handler.debug_print(f"Material Group {mat_idx}: {len(group_exporter_vertices)} verts, {len(group_exporter_polygons)} polys")
+                                if msg_handler.debug:
+                                    msg_handler.debug_print(f"Material Group {mat_idx}: {len(group_exporter_vertices)} verts, {len(group_exporter_polygons)} polys")
 
                                 if polygon_indices_amount <= 65535:
                                     # Fits in one chunk
@@ -1302,6 +1517,7 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                         group_exporter_uvs, 
                                         group_exporter_polygons, 
                                         group_exporter_weights, 
+                                        group_exporter_bone_indices, 
                                         group_unique_bones_list, 
                                         current_texture_path, 
                                         ""
@@ -1314,35 +1530,17 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                     for split_number in range(0, maximum_split_amount):
                                         split_object_name = sub_object_base_name if split_number == 0 else f"{sub_object_base_name}_{split_number}"
                                         
-                                        split_exporter_vertices = []
-                                        split_exporter_normals = []
-                                        split_exporter_uvs = []
-                                        split_exporter_polygons = []
-                                        split_exporter_weights = []
+                                        # Each split takes the next 21845 triangles, their vertices are renumbered in order of first use
+                                        split_corners = group_exporter_polygons[21845 * split_number:21845 * (split_number + 1)].ravel()
+                                        first_corner_indices, split_corner_vertex_indices = CBB_OT_ExportMSH.unique_in_order(split_corners)
+                                        split_vertex_indices = split_corners[first_corner_indices]
                                         
-                                        exporter_vertex_to_split_vertex_map = {}
-                                        
-                                        # Calculate range of triangles for this split
-                                        start_poly = 21845 * split_number
-                                        end_poly = 21845 * (split_number + 1)
-                                        
-                                        # Slice the polygons for this split
-                                        # Using manual loop to remap vertices
-                                        for poly_to_split_index in range(start_poly, end_poly):
-                                            if poly_to_split_index >= len(group_exporter_polygons):
-                                                break
-                                            
-                                            poly_indices = []
-                                            for vertex_index in group_exporter_polygons[poly_to_split_index]:
-                                                if vertex_index not in exporter_vertex_to_split_vertex_map:
-                                                    split_exporter_vertices.append(group_exporter_vertices[vertex_index])
-                                                    split_exporter_normals.append(group_exporter_normals[vertex_index])
-                                                    split_exporter_uvs.append(group_exporter_uvs[vertex_index])
-                                                    split_exporter_weights.append(group_exporter_weights[vertex_index])
-                                                    exporter_vertex_to_split_vertex_map[vertex_index] = len(split_exporter_vertices)-1
-                                                poly_indices.append(exporter_vertex_to_split_vertex_map[vertex_index])
-                                            
-                                            split_exporter_polygons.append([poly_indices[0], poly_indices[1], poly_indices[2]])
+                                        split_exporter_vertices = group_exporter_vertices[split_vertex_indices]
+                                        split_exporter_normals = group_exporter_normals[split_vertex_indices]
+                                        split_exporter_uvs = group_exporter_uvs[split_vertex_indices]
+                                        split_exporter_weights = group_exporter_weights[split_vertex_indices]
+                                        split_exporter_bone_indices = group_exporter_bone_indices[split_vertex_indices]
+                                        split_exporter_polygons = split_corner_vertex_indices.reshape(-1, 3)
 
                                         __add_object_data(
                                             object_amount, 
@@ -1355,6 +1553,7 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                             split_exporter_uvs, 
                                             split_exporter_polygons, 
                                             split_exporter_weights, 
+                                            split_exporter_bone_indices, 
                                             group_unique_bones_list, 
                                             current_texture_path, 
                                             ""
@@ -1373,6 +1572,7 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                 [],  # no uvs
                                 [],  # no polygons
                                 [],  # no weights
+                                [],  # no bone indices
                                 [],  # no bones
                                 "",  # no texture
                                 ""   # no effect
@@ -1391,74 +1591,51 @@ class CBB_OT_ExportMSH(Operator, ExportHelper):
                                 writer.write_fixed_string(6, "ascii", "MESH08")
                             writer.write_ushort(object_amount)
                             for object_index in range(len(object_names)):
-                                writer.write_fixed_string(100, "euc-kr", object_names[object_index])
-                                writer.write_fixed_string(100, "euc-kr", object_parent_names[object_index])
-                                writer.write_converted_matrix(object_world_matrices[object_index])
-                                writer.write_converted_matrix(object_local_matrices[object_index])
-                                writer.write_matrix(object_inverse_parent_matrices[object_index])
-                                writer.write_ushort(object_vertex_amounts[object_index])
-                                writer.write_ushort(object_face_amounts[object_index])
+                                # Each object is assembled in memory and written to the file in one call
+                                object_buffer = io.BytesIO()
+                                object_writer = Utils.Serializer(object_buffer, Utils.Serializer.Endianness.Little, Utils.Serializer.Quaternion_Order.XYZW, Utils.Serializer.Matrix_Order.ColumnMajor, co_conv)
+                                object_writer.write_fixed_string(100, "euc-kr", object_names[object_index])
+                                object_writer.write_fixed_string(100, "euc-kr", object_parent_names[object_index])
+                                object_writer.write_converted_matrix(object_world_matrices[object_index])
+                                object_writer.write_converted_matrix(object_local_matrices[object_index])
+                                object_writer.write_matrix(object_inverse_parent_matrices[object_index])
+                                object_writer.write_ushort(object_vertex_amounts[object_index])
+                                object_writer.write_ushort(object_face_amounts[object_index])
                                 if object_parent_names[object_index] == SkeletonData.INVALID_NAME:
-                                    writer.write_ushort(object_weight_amounts[object_index])
+                                    object_writer.write_ushort(object_weight_amounts[object_index])
                                 else:
-                                    writer.write_ushort(0)
-                                writer.write_fixed_string(100, "euc-kr", object_texture_paths[object_index])
-                                writer.write_fixed_string(100, "euc-kr", object_effect_paths[object_index])
-                                file.write(bytearray(36))
-                                writer.write_uint(1)
-                                writer.write_uint(256)
-                                writer.write_uint(1)
-                                file.write(bytearray(47))
+                                    object_writer.write_ushort(0)
+                                object_writer.write_fixed_string(100, "euc-kr", object_texture_paths[object_index])
+                                object_writer.write_fixed_string(100, "euc-kr", object_effect_paths[object_index])
+                                object_buffer.write(bytearray(36))
+                                object_writer.write_uint(1)
+                                object_writer.write_uint(256)
+                                object_writer.write_uint(1)
+                                object_buffer.write(bytearray(47))
                                 if mesh_export_format == "MESH08":
-                                    writer.write_ushort(object_vertex_amounts[object_index])
-                                    for vertex_position, weight_values, unique_bone_indices, vertex_normal, vertex_uv, vertex_binormal in object_vertice_data[object_index]:
-                                        writer.write_converted_vector3f(vertex_position)
-                                        writer.write_values("3f", weight_values)
-                                        if object_parent_names[object_index] == SkeletonData.INVALID_NAME:
-                                            writer.write_values("4h", unique_bone_indices)
-                                        else:
-                                            # For some reason, if a certain object holds no weight data, having the fourth index as not 0 causes the mesh to go invisible.
-                                            writer.write_values("4h", (-1, -1, -1, 0))
-                                        writer.write_converted_vector3f(Vector(vertex_normal))
-                                        writer.write_values("2f", (vertex_uv[0], -vertex_uv[1]))
-                                        writer.write_converted_vector3f(Vector(vertex_binormal))
+                                    object_writer.write_ushort(object_vertex_amounts[object_index])
+                                    object_buffer.write(object_vertice_data[object_index].tobytes())
                                     
-                                    writer.write_ushort(object_face_amounts[object_index]*3)
-                                    for face_index in object_face_data[object_index]:
-                                        writer.write_ushort(face_index)
+                                    object_writer.write_ushort(object_face_amounts[object_index]*3)
+                                    object_buffer.write(object_face_data[object_index].tobytes())
                                     
-                                    writer.write_ushort(len(object_weight_data[object_index]))
+                                    object_writer.write_ushort(len(object_weight_data[object_index]))
                                     for bone_amount, bone_names in object_weight_data[object_index]:
-                                        writer.write_uint(bone_amount)
+                                        object_writer.write_uint(bone_amount)
                                         for bone_name in bone_names:
-                                            writer.write_fixed_string(100, "euc-kr", bone_name)
-                                        file.write(bytearray(100*(4 -bone_amount)))
+                                            object_writer.write_fixed_string(100, "euc-kr", bone_name)
+                                        object_buffer.write(bytearray(100*(4 -bone_amount)))
                                 else:
-                                    for vertex_position, unknown, vertex_normal in object_vertice_data[object_index]:
-                                        writer.write_converted_vector3f(vertex_position)
-                                        writer.write_float(unknown)
-                                        #writer.write_converted_vector3f(Vector(vertex_normal))
-                                        writer.write_vector3f(Vector(vertex_normal))
-                                    for tri, face_normals_to_export, face_uvs_to_export, unknown in object_face_data[object_index]:
-                                        writer.write_values("3I", tri)
-                                        for face_normal in face_normals_to_export:
-                                            writer.write_converted_vector3f(Vector(face_normal))
-                                        for face_uv in face_uvs_to_export:
-                                            writer.write_vector3f(face_uv)
-                                        writer.write_uint(unknown)
+                                    object_buffer.write(object_vertice_data[object_index].tobytes())
+                                    object_buffer.write(object_face_data[object_index].tobytes())
                                     
-                                    writer.write_uint(len(object_unique_bones_lists[object_index]))
+                                    object_writer.write_uint(len(object_unique_bones_lists[object_index]))
                                     for unique_bone in object_unique_bones_lists[object_index]:
-                                        writer.write_fixed_string(100, "euc-kr", unique_bone)
+                                        object_writer.write_fixed_string(100, "euc-kr", unique_bone)
                                     if object_parent_names[object_index] == SkeletonData.INVALID_NAME:
-                                        for vertex_index, valid_bone_amount, export_bone_indices, export_weight_values in object_weight_data[object_index]:
-                                            writer.write_uint(vertex_index)
-                                            writer.write_uint(valid_bone_amount)
-                                            for bone_index in export_bone_indices:
-                                                writer.write_int(bone_index)
-                                            for weight_value in export_weight_values:
-                                                writer.write_float(weight_value)
-                                            
+                                        object_buffer.write(object_weight_data[object_index].tobytes())
+                                
+                                file.write(object_buffer.getbuffer())
                                     
                         except Exception as e:
                             file.close()
@@ -1491,6 +1668,8 @@ class CBB_OT_SetBindPose(Operator):
 
     def execute(self, context):
         count = 0
+        # Parent transforms are read from the scene as evaluated once here, the edits made in the loop don't trigger re-evaluation
+        depsgraph = context.evaluated_depsgraph_get()
         for obj in context.selected_objects:
             if obj.type not in {"MESH", "EMPTY"}:
                 continue
@@ -1503,14 +1682,15 @@ class CBB_OT_SetBindPose(Operator):
             
             # Recalculate matrix_parent_inverse to cancel parent contribution
             if obj.parent:
+                evaluated_parent = obj.parent.evaluated_get(depsgraph)
                 if obj.parent_type == "BONE" and obj.parent_bone:
-                    pose_bone = obj.parent.pose.bones[obj.parent_bone]
-                    effective_parent_world = obj.parent.matrix_world @ pose_bone.matrix
+                    pose_bone = evaluated_parent.pose.bones[obj.parent_bone]
+                    effective_parent_world = evaluated_parent.matrix_world @ pose_bone.matrix
                     vec = pose_bone.head - pose_bone.tail
                     trans = Matrix.Translation(vec)
                     obj.matrix_parent_inverse = effective_parent_world.inverted_safe() @ trans
                 else:
-                    effective_parent_world = obj.parent.matrix_world
+                    effective_parent_world = evaluated_parent.matrix_world
                     obj.matrix_parent_inverse = effective_parent_world.inverted()
             else:
                 obj.matrix_parent_inverse = Matrix.Identity(4)
@@ -1536,46 +1716,55 @@ class CBB_OT_ClearBindPose(Operator):
 
     @classmethod
     def poll(cls, context):
-        return any("msh_bind_matrix" in obj for obj in context.selected_objects)
-
-    def execute(self, context):
-        count = 0
+        # Runs on every menu redraw, stops at the first object holding a bind pose
         for obj in context.selected_objects:
             if "msh_bind_matrix" in obj:
-                del obj["msh_bind_matrix"]
-                count += 1
+                return True
+        return False
+
+    def execute(self, context):
+        # pop checks for and removes the property in a single call
+        count = sum(1 for obj in context.selected_objects if obj.pop("msh_bind_matrix", None) is not None)
         self.report({"INFO"}, f"Bind pose cleared for {count} object(s).")
         return {"FINISHED"}
 
 
+# Operator ids used by the menu draw callbacks, resolved once at import
+_SET_BIND_POSE_IDNAME = CBB_OT_SetBindPose.bl_idname
+_CLEAR_BIND_POSE_IDNAME = CBB_OT_ClearBindPose.bl_idname
+_IMPORT_MSH_IDNAME = CBB_OT_ImportMSH.bl_idname
+_EXPORT_MSH_IDNAME = CBB_OT_ExportMSH.bl_idname
+
 def menu_func_bind_pose(self, context):
     self.layout.separator()
-    self.layout.operator(CBB_OT_SetBindPose.bl_idname)
-    self.layout.operator(CBB_OT_ClearBindPose.bl_idname)
+    self.layout.operator(_SET_BIND_POSE_IDNAME)
+    self.layout.operator(_CLEAR_BIND_POSE_IDNAME)
 
 
 def menu_func_import(self, context):
-    self.layout.operator(CBB_OT_ImportMSH.bl_idname, text="MSH (.msh)")
+    self.layout.operator(_IMPORT_MSH_IDNAME, text="MSH (.msh)")
 
 def menu_func_export(self, context):
-    self.layout.operator(CBB_OT_ExportMSH.bl_idname, text="MSH (.msh)")
+    self.layout.operator(_EXPORT_MSH_IDNAME, text="MSH (.msh)")
+
+classes = (
+    CBB_OT_ImportMSH,
+    CBB_FH_ImportMSH,
+    CBB_OT_ExportMSH,
+    CBB_OT_SetBindPose,
+    CBB_OT_ClearBindPose,
+)
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
 def register():
-    bpy.utils.register_class(CBB_OT_ImportMSH)
-    bpy.utils.register_class(CBB_FH_ImportMSH)
-    bpy.utils.register_class(CBB_OT_ExportMSH)
-    bpy.utils.register_class(CBB_OT_SetBindPose)
-    bpy.utils.register_class(CBB_OT_ClearBindPose)
+    _register_classes()
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
     bpy.types.VIEW3D_MT_object_context_menu.append(menu_func_bind_pose)
 
 def unregister():
-    bpy.utils.unregister_class(CBB_OT_ImportMSH)
-    bpy.utils.unregister_class(CBB_FH_ImportMSH)
-    bpy.utils.unregister_class(CBB_OT_ExportMSH)
-    bpy.utils.unregister_class(CBB_OT_SetBindPose)
-    bpy.utils.unregister_class(CBB_OT_ClearBindPose)
+    _unregister_classes()
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
     bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func_bind_pose)
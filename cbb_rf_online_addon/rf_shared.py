@@ -16,6 +16,19 @@ from . import texture_utils
 
 SCALE_FACTOR = 1
 
+# Encrypted DDS headers are xored with this key, as 32 little endian uints
+DDS_HEADER_PASSWORD = np.frombuffer(bytes([
+    0x2E, 0x80, 0x4D, 0x76, 0x2E, 0xF8, 0xD1, 0xF0, 0xBD, 0x3F, 0x86, 0x81, 0x58, 0x2C, 0x3F, 0x3F, 
+    0x2E, 0x2E, 0x67, 0x6F, 0x3F, 0x40, 0x3F, 0x78, 0x3C, 0x3F, 0xF1, 0xC0, 0xA5, 0xF6, 0x3B, 0x9F, 
+    0xC1, 0x20, 0x3F, 0xD7, 0xC8, 0xC1, 0xE9, 0x85, 0x86, 0xBD, 0xEF, 0x56, 0x3F, 0xA1, 0xFB, 0x2E, 
+    0x87, 0x86, 0x61, 0x4C, 0x21, 0x3B, 0x4E, 0xB4, 0x78, 0x57, 0xAE, 0x97, 0x3F, 0x2E, 0x4A, 0x2E, 
+    0x3F, 0x4C, 0x2E, 0x44, 0xCD, 0xC5, 0x5F, 0xE8, 0xE9, 0xEC, 0xEB, 0xBD, 0xBE, 0xBB, 0xF7, 0x6C, 
+    0x2E, 0xF2, 0xE4, 0x2E, 0x3F, 0x3F, 0x97, 0x9F, 0x9D, 0xB3, 0x21, 0xB9, 0x76, 0x65, 0x54, 0x3F, 
+    0xE6, 0xF6, 0xC6, 0xF0, 0x79, 0xDB, 0xE2, 0xB2, 0x4B, 0x2E, 0x2E, 0xEB, 0xD3, 0xD3, 0xCA, 0xAB, 
+    0xEA, 0xC7, 0xED, 0x9C, 0xC7, 0xD9, 0xD0, 0x65, 0x48, 0xB4, 0xFA, 0x35, 0x2E, 0x2E, 0x6A, 0x9B, 
+    #0xAF, 0x7E, 0xD6, 0xB7, 0x79, 
+]), dtype="<u4")
+
 class RFShared(Operator):
     bl_idname = "cbb.rf_shared"
     bl_label = "RF Shared"
@@ -23,22 +36,17 @@ class RFShared(Operator):
     
     @staticmethod
     def unlock_dds(buffer):
-        password = bytes([
-            0x2E, 0x80, 0x4D, 0x76, 0x2E, 0xF8, 0xD1, 0xF0, 0xBD, 0x3F, 0x86, 0x81, 0x58, 0x2C, 0x3F, 0x3F, 
-            0x2E, 0x2E, 0x67, 0x6F, 0x3F, 0x40, 0x3F, 0x78, 0x3C, 0x3F, 0xF1, 0xC0, 0xA5, 0xF6, 0x3B, 0x9F, 
-            0xC1, 0x20, 0x3F, 0xD7, 0xC8, 0xC1, 0xE9, 0x85, 0x86, 0xBD, 0xEF, 0x56, 0x3F, 0xA1, 0xFB, 0x2E, 
-            0x87, 0x86, 0x61, 0x4C, 0x21, 0x3B, 0x4E, 0xB4, 0x78, 0x57, 0xAE, 0x97, 0x3F, 0x2E, 0x4A, 0x2E, 
-            0x3F, 0x4C, 0x2E, 0x44, 0xCD, 0xC5, 0x5F, 0xE8, 0xE9, 0xEC, 0xEB, 0xBD, 0xBE, 0xBB, 0xF7, 0x6C, 
-            0x2E, 0xF2, 0xE4, 0x2E, 0x3F, 0x3F, 0x97, 0x9F, 0x9D, 0xB3, 0x21, 0xB9, 0x76, 0x65, 0x54, 0x3F, 
-            0xE6, 0xF6, 0xC6, 0xF0, 0x79, 0xDB, 0xE2, 0xB2, 0x4B, 0x2E, 0x2E, 0xEB, 0xD3, 0xD3, 0xCA, 0xAB, 
-            0xEA, 0xC7, 0xED, 0x9C, 0xC7, 0xD9, 0xD0, 0x65, 0x48, 0xB4, 0xFA, 0x35, 0x2E, 0x2E, 0x6A, 0x9B, 
-            #0xAF, 0x7E, 0xD6, 0xB7, 0x79, 
-        ])
-        password = struct.unpack('<32I', password)
         for i in range(32):
-            buffer[i] ^= password[i]
+            buffer[i] ^= int(DDS_HEADER_PASSWORD[i])
         return buffer
     
+    @staticmethod
+    def unlock_dds_header(dds_header: bytes) -> bytes:
+        """
+        Decrypts a whole 128 bytes DDS header at once.
+        """
+        return (np.frombuffer(dds_header, dtype="<u4") ^ DDS_HEADER_PASSWORD).tobytes()
+    
     @staticmethod
     def get_materials_from_r3m_file(directory, file_name_stem)-> list[R3MMaterial]:
         """
@@ -123,8 +131,7 @@ class RFShared(Operator):
                 size = reader.read_uint()
                 dds_header = bytearray(r3t_file.read(128))
                 if not dds_header[:4] == b'DDS ':
-                    dds_header = RFShared.unlock_dds(list(struct.unpack('<32I', dds_header)))
-                    dds_header = struct.pack('<32I', *dds_header)
+                    dds_header = RFShared.unlock_dds_header(dds_header)
                 texture_data = r3t_file.read(size - 128)
 
                 temp_file = tempfile.NamedTemporaryFile(suffix=".dds", delete=False)
@@ -181,8 +188,7 @@ class RFShared(Operator):
                 dds_header = bytearray(r3t_file.read(128))
 
                 if not dds_header[:4] == b'DDS ':
-                    dds_header = RFShared.unlock_dds(list(struct.unpack('<32I', dds_header)))
-                    dds_header = struct.pack('<32I', *dds_header)
+                    dds_header = RFShared.unlock_dds_header(dds_header)
 
                 texture_data = r3t_file.read(size - 128)
                 width, height = struct.unpack('<II', dds_header[12:20])
@@ -146,13 +146,31 @@ def decode_dxt5_alpha_manual(dds_data: bytes, width: int, height: int) -> np.nda
 
 def analyze_dds_alpha(dds_path: str) -> Dict[str, any]:
     """
-    Analyze DDS alpha channel and recommend transparency mode.
-    Uses manual decoding for DXT1 and DXT3, texture2ddecoder for DXT5 if available.
+    Analyze the alpha channel of a DDS file on disk, see analyze_dds_alpha_bytes.
     """
     try:
         with open(dds_path, 'rb') as f:
             dds_data = f.read()
-        
+    except OSError as e:
+        print(f"Error analyzing DDS alpha: {e}")
+        # Conservative fallback
+        return {
+            'has_alpha': True,
+            'mode': 'BLEND',
+            'threshold': 0.5,
+            'histogram': {},
+            'binary_percentage': 0.0
+        }
+    
+    return analyze_dds_alpha_bytes(dds_data)
+
+
+def analyze_dds_alpha_bytes(dds_data: bytes) -> Dict[str, any]:
+    """
+    Analyze DDS alpha channel and recommend transparency mode, from DDS data already in memory.
+    Uses manual decoding for DXT1 and DXT3, texture2ddecoder for DXT5 if available.
+    """
+    try:
         if dds_data[:4] != b'DDS ':
             raise ValueError("Not a valid DDS file")
         
@@ -274,6 +292,13 @@ def ensure_dependencies() -> bool:
     return True
     
 
+def get_image_pixels(image: bpy.types.Image) -> np.ndarray:
+    """Read all pixels of a Blender image in one call, instead of going through a Python tuple with image.pixels[:]"""
+    pixels = np.empty(len(image.pixels), dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels
+
+
 def get_dxt_format(image: bpy.types.Image) -> str:
     """Determine the best DXT format for the image"""
     # Check if image has alpha
@@ -302,7 +327,7 @@ def convert_to_dds(image: bpy.types.Image) -> Optional[bytes]:
          tempfile.NamedTemporaryFile(suffix='.dds', delete=False) as temp_out:
         
         # Get image data
-        pixels = np.array(image.pixels[:])
+        pixels = get_image_pixels(image)
         width, height = image.size
         rgba = (pixels.reshape(height, width, 4) * 255).astype(np.uint8)
         
@@ -366,7 +391,7 @@ def convert_to_dds_with_format(image: bpy.types.Image, format: D3DFormat = D3DFo
         raise ValueError(f"Invalid image size for {image.name}")
     
     width, height = image.size
-    pixels = np.array(image.pixels[:])
+    pixels = get_image_pixels(image)
     rgba = (pixels.reshape(height, width, 4) * 255).astype(np.uint8)
 
     # Flip the Y-axis of the image
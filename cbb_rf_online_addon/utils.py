@@ -20,6 +20,77 @@ from enum import Enum
 import io
 from typing import NamedTuple, Optional
 from pathlib import Path
+from functools import cached_property
+import numpy as np
+
+HAS_NUMBA = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    # Signatures are given so the kernels are compiled when the addon is loaded rather than during the first import
+    @njit("void(f4[:], f4[:,:], f4[:,:])", cache=True, fastmath=True, parallel=True)
+    def _safe_quaternion_multiply_kernel(left_rotation, rotations, multiplied_rotations):
+        w1 = left_rotation[0]
+        x1 = left_rotation[1]
+        y1 = left_rotation[2]
+        z1 = left_rotation[3]
+        for i in prange(rotations.shape[0]):
+            w2 = rotations[i, 0]
+            x2 = rotations[i, 1]
+            y2 = rotations[i, 2]
+            z2 = rotations[i, 3]
+            # Same hemisphere flip as Utils.safe_quaternion_multiply
+            if w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2 < 0.0:
+                w2 = -w2
+                x2 = -x2
+                y2 = -y2
+                z2 = -z2
+            multiplied_rotations[i, 0] = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+            multiplied_rotations[i, 1] = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+            multiplied_rotations[i, 2] = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+            multiplied_rotations[i, 3] = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+
+    @njit("void(f4[:], f4[:,:], f4[:,:], f4[:,:])", cache=True, fastmath=True, parallel=True)
+    def _local_positions_kernel(parent_position, inverse_rotation_matrix, child_positions, local_positions):
+        for i in prange(child_positions.shape[0]):
+            x = child_positions[i, 0] - parent_position[0]
+            y = child_positions[i, 1] - parent_position[1]
+            z = child_positions[i, 2] - parent_position[2]
+            for axis in range(3):
+                local_positions[i, axis] = inverse_rotation_matrix[axis, 0] * x + inverse_rotation_matrix[axis, 1] * y + inverse_rotation_matrix[axis, 2] * z
+
+    @njit("void(f4[:,:], i8[:], f4[:], f4[:,:])", cache=True, fastmath=True, parallel=True)
+    def _swizzle_kernel(values, indices, signs, converted_values):
+        for i in prange(values.shape[0]):
+            for component in range(indices.shape[0]):
+                converted_values[i, component] = values[i, indices[component]] * signs[component]
+
+    @njit("void(i8[:], i8[:], f4[:], i8[:,:], f4[:,:])", cache=True)
+    def _strongest_weights_kernel(entry_vertices, entry_bones, entry_weights, vertex_bone_indices, vertex_weights):
+        # Entries are grouped by vertex, each is inserted after the kept ones with an equal or greater weight
+        slot_amount = vertex_weights.shape[1]
+        filled_slots = 0
+        for i in range(entry_vertices.shape[0]):
+            vertex = entry_vertices[i]
+            if i == 0 or vertex != entry_vertices[i - 1]:
+                filled_slots = 0
+            weight = entry_weights[i]
+            slot = 0
+            while slot < filled_slots and vertex_weights[vertex, slot] >= weight:
+                slot += 1
+            if slot == slot_amount:
+                continue
+            for moved_slot in range(min(filled_slots, slot_amount - 1), slot, -1):
+                vertex_weights[vertex, moved_slot] = vertex_weights[vertex, moved_slot - 1]
+                vertex_bone_indices[vertex, moved_slot] = vertex_bone_indices[vertex, moved_slot - 1]
+            vertex_weights[vertex, slot] = weight
+            vertex_bone_indices[vertex, slot] = entry_bones[i]
+            filled_slots = min(filled_slots + 1, slot_amount)
 
 _usage_counter = 0
 class CoordsSys(Enum):
@@ -78,7 +149,61 @@ class Utils(Operator):
         local_rotation =  Utils.safe_quaternion_multiply(parent_rotation.conjugated(), child_rotation)
 
         return local_rotation
-    
+
+    @staticmethod
+    def get_local_positions_array(parent_position: Vector, parent_rotation: Quaternion, child_positions: np.ndarray) -> np.ndarray:
+        """
+        Array version of get_local_position, converting all child world positions at once.
+
+        :param parent_position: mathutils.Vector representing the parent's position.
+        :param parent_rotation: mathutils.Quaternion representing the parent's rotation.
+        :param child_positions: (N, 3) array of the child's world positions.
+        :return: (N, 3) float32 array of the child's local positions.
+        """
+        inverse_rotation_matrix = np.array(parent_rotation.conjugated().to_matrix(), dtype=np.float32)
+        if HAS_NUMBA:
+            local_positions = np.empty((len(child_positions), 3), dtype=np.float32)
+            _local_positions_kernel(np.array(parent_position, dtype=np.float32), inverse_rotation_matrix, np.asarray(child_positions, dtype=np.float32), local_positions)
+            return local_positions
+        relative_positions = child_positions - np.array(parent_position, dtype=np.float32)
+        return (relative_positions @ inverse_rotation_matrix.T).astype(np.float32, copy=False)
+
+    @staticmethod
+    def get_local_rotations_array(parent_rotation: Quaternion, child_rotations: np.ndarray) -> np.ndarray:
+        """
+        Array version of get_local_rotation, converting all child world rotations at once.
+
+        :param parent_rotation: mathutils.Quaternion representing the parent's rotation.
+        :param child_rotations: (N, 4) array of the child's world rotations in WXYZ order.
+        :return: (N, 4) float32 array of the child's local rotations in WXYZ order.
+        """
+        return Utils.safe_quaternion_multiply_array(parent_rotation.conjugated(), child_rotations)
+
+    @staticmethod
+    def get_world_positions_array(parent_position: Vector, parent_rotation: Quaternion, child_local_positions: np.ndarray) -> np.ndarray:
+        """
+        Array version of get_world_position, converting all child local positions at once.
+
+        :param parent_position: mathutils.Vector representing the parent's position.
+        :param parent_rotation: mathutils.Quaternion representing the parent's rotation.
+        :param child_local_positions: (N, 3) array of the child's local positions.
+        :return: (N, 3) float32 array of the child's world positions.
+        """
+        # Every row shares the parent rotation, so converting it to a matrix once costs less per row than a quaternion rotation
+        rotation_matrix = np.array(parent_rotation.to_matrix(), dtype=np.float32)
+        return (child_local_positions @ rotation_matrix.T + np.array(parent_position, dtype=np.float32)).astype(np.float32, copy=False)
+
+    @staticmethod
+    def get_world_rotations_array(parent_rotation: Quaternion, child_local_rotations: np.ndarray) -> np.ndarray:
+        """
+        Array version of get_world_rotation, converting all child local rotations at once.
+
+        :param parent_rotation: mathutils.Quaternion representing the parent's rotation.
+        :param child_local_rotations: (N, 4) array of the child's local rotations in WXYZ order.
+        :return: (N, 4) float32 array of the child's world rotations in WXYZ order.
+        """
+        return Utils.safe_quaternion_multiply_array(parent_rotation, child_local_rotations)
+
     @staticmethod
     def get_world_rotation(parent_rotation: Quaternion, child_local_rotation: Quaternion) -> Quaternion:
         """
@@ -337,6 +462,52 @@ class Utils(Operator):
             q2 = Quaternion((-q2.w, -q2.x, -q2.y, -q2.z))
         return q1 @ q2
     
+    @staticmethod
+    def safe_quaternion_multiply_array(q1: Quaternion, q2: np.ndarray) -> np.ndarray:
+        """
+        Array version of safe_quaternion_multiply, multiplying q1 with every row of the (N, 4) WXYZ array q2.
+        """
+        w, x, y, z = q1
+        if HAS_NUMBA:
+            multiplied_rotations = np.empty((len(q2), 4), dtype=np.float32)
+            _safe_quaternion_multiply_kernel(np.array((w, x, y, z), dtype=np.float32), np.asarray(q2, dtype=np.float32), multiplied_rotations)
+            return multiplied_rotations
+        # Hamilton product with q1 on the left, as a matrix acting on the q2 rows
+        left_product_matrix = np.array((
+            (w, -x, -y, -z),
+            (x,  w, -z,  y),
+            (y,  z,  w, -x),
+            (z, -y,  x,  w),
+        ), dtype=np.float32)
+        signs = np.where(q2 @ np.array((w, x, y, z), dtype=np.float32) < 0.0, -1.0, 1.0).astype(np.float32)
+        return (q2 * signs[:, None]) @ left_product_matrix.T
+    
+    @staticmethod
+    def get_strongest_weights_array(entry_vertices: np.ndarray, entry_bones: np.ndarray, entry_weights: np.ndarray, vertex_amount: int, slot_amount: int = 4) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Keeps the slot_amount strongest weights of every vertex from flat (vertex, bone, weight) entries grouped by vertex.
+        Equal weights keep their entry order, unused slots have bone index -1 and weight 0.
+
+        :return: (vertex_amount, slot_amount) int64 array of bone indices and float32 array of weights, strongest first.
+        """
+        entry_vertices = np.asarray(entry_vertices, dtype=np.int64)
+        entry_bones = np.asarray(entry_bones, dtype=np.int64)
+        entry_weights = np.asarray(entry_weights, dtype=np.float32)
+        vertex_bone_indices = np.full((vertex_amount, slot_amount), -1, dtype=np.int64)
+        vertex_weights = np.zeros((vertex_amount, slot_amount), dtype=np.float32)
+        if HAS_NUMBA and slot_amount > 0:
+            _strongest_weights_kernel(entry_vertices, entry_bones, entry_weights, vertex_bone_indices, vertex_weights)
+            return vertex_bone_indices, vertex_weights
+        entry_order = np.lexsort((-entry_weights, entry_vertices))
+        sorted_entry_vertices = entry_vertices[entry_order]
+        entry_ranks = np.arange(len(entry_order)) - np.searchsorted(sorted_entry_vertices, sorted_entry_vertices)
+        kept_entries = entry_ranks < slot_amount
+        kept_vertices = sorted_entry_vertices[kept_entries]
+        kept_ranks = entry_ranks[kept_entries]
+        vertex_bone_indices[kept_vertices, kept_ranks] = entry_bones[entry_order][kept_entries]
+        vertex_weights[kept_vertices, kept_ranks] = entry_weights[entry_order][kept_entries]
+        return vertex_bone_indices, vertex_weights
+    
     @staticmethod
     def decompose_blender_matrix_position_rotation(matrix: Matrix) -> tuple[Vector, Quaternion]:
         # Extract position
@@ -346,6 +517,48 @@ class Utils(Operator):
         rotation = matrix.to_quaternion()
         return position, rotation
     
+    @staticmethod
+    def decompose_matrices_array(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Array version of to_translation, to_quaternion and to_scale for a (N, 4, 4) array of matrices.
+
+        :return: (N, 3) positions, (N, 4) normalized rotations in WXYZ order with a positive W, and (N, 3) scales.
+        """
+        positions = matrices[:, :3, 3].copy()
+        scales = np.linalg.norm(matrices[:, :3, :3], axis=1)
+
+        rotation_matrices = matrices[:, :3, :3] / np.where(scales == 0.0, 1.0, scales)[:, None, :]
+        # Same as mathutils, mirrored matrices are negated so a rotation can be extracted
+        rotation_matrices[np.linalg.det(rotation_matrices) < 0.0] *= -1.0
+
+        r = rotation_matrices
+        trace = r[:, 0, 0] + r[:, 1, 1] + r[:, 2, 2]
+        rotations = np.empty((len(matrices), 4), dtype=np.float64)
+
+        # Shepperd's method, picking the largest of w, x, y and z to divide by
+        branches = np.argmax(np.stack((trace, r[:, 0, 0], r[:, 1, 1], r[:, 2, 2]), axis=1), axis=1)
+
+        i = branches == 0
+        s = np.sqrt(trace[i] + 1.0) * 2.0
+        rotations[i] = np.stack((0.25 * s, (r[i, 2, 1] - r[i, 1, 2]) / s, (r[i, 0, 2] - r[i, 2, 0]) / s, (r[i, 1, 0] - r[i, 0, 1]) / s), axis=1)
+
+        i = branches == 1
+        s = np.sqrt(1.0 + r[i, 0, 0] - r[i, 1, 1] - r[i, 2, 2]) * 2.0
+        rotations[i] = np.stack(((r[i, 2, 1] - r[i, 1, 2]) / s, 0.25 * s, (r[i, 0, 1] + r[i, 1, 0]) / s, (r[i, 0, 2] + r[i, 2, 0]) / s), axis=1)
+
+        i = branches == 2
+        s = np.sqrt(1.0 + r[i, 1, 1] - r[i, 0, 0] - r[i, 2, 2]) * 2.0
+        rotations[i] = np.stack(((r[i, 0, 2] - r[i, 2, 0]) / s, (r[i, 0, 1] + r[i, 1, 0]) / s, 0.25 * s, (r[i, 1, 2] + r[i, 2, 1]) / s), axis=1)
+
+        i = branches == 3
+        s = np.sqrt(1.0 + r[i, 2, 2] - r[i, 0, 0] - r[i, 1, 1]) * 2.0
+        rotations[i] = np.stack(((r[i, 1, 0] - r[i, 0, 1]) / s, (r[i, 0, 2] + r[i, 2, 0]) / s, (r[i, 1, 2] + r[i, 2, 1]) / s, 0.25 * s), axis=1)
+
+        rotations /= np.linalg.norm(rotations, axis=1, keepdims=True)
+        rotations[rotations[:, 0] < 0.0] *= -1.0
+
+        return positions, rotations, scales
+
     @staticmethod
     def compose_matrix_from_position_rotation_scale(position: Vector, rotation: Quaternion, scale: Vector):
         return Matrix.Translation(position) @ rotation.to_matrix().to_4x4() @ Matrix.Diagonal(scale).to_4x4()
@@ -398,6 +611,57 @@ class Utils(Operator):
         def convert_quaternion(self, quaternion: Quaternion) -> Quaternion:
             return Utils.convert_quaternion(self.source, self.target, quaternion)
         
+        @cached_property
+        def vector3f_matrix(self) -> np.ndarray:
+            """
+            3x3 matrix equivalent to convert_vector3f, since all conversions are only axis swaps and sign flips.
+            """
+            return np.array([tuple(self.convert_vector3f(Vector(axis))) for axis in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))], dtype=np.float32).T
+        
+        @cached_property
+        def quaternion_matrix(self) -> np.ndarray:
+            """
+            4x4 matrix equivalent to convert_quaternion, operating on quaternions in WXYZ order.
+            """
+            return np.array([tuple(self.convert_quaternion(Quaternion(axis))) for axis in ((1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0), (0.0, 0.0, 1.0, 0.0), (0.0, 0.0, 0.0, 1.0))], dtype=np.float32).T
+        
+        @staticmethod
+        def __matrix_to_swizzle(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            """
+            Source component index and sign of each converted component, for a matrix with a single +1 or -1 per row.
+            """
+            indices = np.abs(matrix).argmax(axis=1)
+            return indices, matrix[np.arange(len(matrix)), indices]
+        
+        @staticmethod
+        def __apply_swizzle(values: np.ndarray, indices: np.ndarray, signs: np.ndarray) -> np.ndarray:
+            if HAS_NUMBA:
+                converted_values = np.empty((len(values), len(indices)), dtype=np.float32)
+                # The kernel is compiled for writable arrays, read-only views such as np.frombuffer results are copied first
+                _swizzle_kernel(np.require(values, dtype=np.float32, requirements="W"), indices.astype(np.int64, copy=False), signs.astype(np.float32, copy=False), converted_values)
+                return converted_values
+            return values[:, indices] * signs
+        
+        @cached_property
+        def vector3f_swizzle(self) -> tuple[np.ndarray, np.ndarray]:
+            return Utils.CoordinatesConverter.__matrix_to_swizzle(self.vector3f_matrix)
+        
+        @cached_property
+        def quaternion_swizzle(self) -> tuple[np.ndarray, np.ndarray]:
+            return Utils.CoordinatesConverter.__matrix_to_swizzle(self.quaternion_matrix)
+        
+        def convert_vector3f_array(self, vectors: np.ndarray) -> np.ndarray:
+            """
+            Converts a (N,3) array of vectors at once.
+            """
+            return Utils.CoordinatesConverter.__apply_swizzle(vectors, *self.vector3f_swizzle)
+        
+        def convert_quaternion_array(self, quaternions: np.ndarray) -> np.ndarray:
+            """
+            Converts a (N,4) array of quaternions in WXYZ order at once.
+            """
+            return Utils.CoordinatesConverter.__apply_swizzle(quaternions, *self.quaternion_swizzle)
+        
         def convert_matrix(self, matrix: Matrix) -> Matrix:
             translation, rotation, scale = Utils.decompose_matrix_position_rotation_scale(matrix)
         